@@ -1,13 +1,16 @@
 """Client module for connecting to the file search server."""
 
+import selectors
 import socket
 import ssl
+import sys
 import time
-import threading
-import queue
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 from core.logger import logger
 from core.config_loader import get_config_value
+from core.framing import recv_msg, send_msg
+from core.socket_options import create_client_socket
+from core.ssl_cache import client_ssl_context
 from config.settings import CONFIG_FILE_PATH
 
 
@@ -43,100 +46,91 @@ class FileSearchClient:
         """
         Establish a mutual TLS (mTLS) connection.
 
+        The TCP connection is opened first and, when SSL is enabled,
+        the TLS handshake is performed on it.
+
         Returns:
             Optional[socket.socket]:
                 A connected socket or None if the connection fails.
         """
+        raw_socket = create_client_socket()
         try:
-            raw_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            raw_socket.connect((self.host, self.port))
             if self.ssl_enabled:
-                context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-                context.load_cert_chain(
-                    certfile=self.client_cert, keyfile=self.client_key
+                context = client_ssl_context(
+                    self.client_cert, self.client_key, self.server_cert
                 )
-                context.verify_mode = ssl.CERT_REQUIRED
-                context.load_verify_locations(self.server_cert)
                 return context.wrap_socket(
                     raw_socket, server_hostname=self.host
                 )
 
             return raw_socket
         except (OSError, ssl.SSLError) as e:
+            raw_socket.close()
             logger.error("SSL connection setup failed: %s", e)
             return None
 
-    def _handle_user_input(
-        self,
-        conn: socket.socket,
-        stop_event: threading.Event,
-        response_queue: queue.Queue,
-    ) -> None:
-        """Handle user input for queries."""
-        while not stop_event.is_set():
-            try:
-                query = input("Enter the string to search: ").strip()
-                if stop_event.is_set():
-                    break
-                if not query:
-                    continue
-                if query.lower() in {"exit", "quit"}:
-                    print("Exiting client...")
-                    stop_event.set()
-                    break
-
-                conn.sendall(query.encode("utf-8"))
-
-                try:
-                    response = response_queue.get(timeout=10)
-                    parts = response.split("\n", 1)
-                    print(f"Server Response: {parts[0]}")
-                    if len(parts) > 1:
-                        print(parts[1])
-                except queue.Empty:
-                    print("No response from server.")
-
-            except KeyboardInterrupt:
-                print("\nInterrupted by user. Exiting.")
-                stop_event.set()
-                break
-
-    def _listen_for_server(
-        self,
-        conn: socket.socket,
-        stop_event: threading.Event,
-        response_queue: queue.Queue,
-    ) -> None:
-        """Background listener thread for receiving server messages."""
-        while not stop_event.is_set():
-            try:
-                data = conn.recv(4096)
-                if not data:
-                    print("Server closed the connection.")
-                    stop_event.set()
-                    break
-                message = data.decode("utf-8")
-                if "__TIMEOUT__" in message:
-                    print("\nConnection expired! Press Enter to restart.")
-                    stop_event.set()
-
-                response_queue.put(message)
-            except OSError:
-                stop_event.set()
-                break
-
-    def _setup_listener(
-        self,
-        conn: socket.socket,
-        stop_event: threading.Event,
-        response_queue: queue.Queue,
-    ) -> threading.Thread:
-        """Start and return the listener thread."""
-        listener_thread = threading.Thread(
-            target=self._listen_for_server,
-            args=(conn, stop_event, response_queue),
-        )
-        listener_thread.start()
-        return listener_thread
+    @staticmethod
+    def _prompt() -> None:
+        """Print the input prompt without waiting for a line."""
+        print("Enter the string to search: ", end="", flush=True)
+
+    def _on_stdin(self, conn: socket.socket) -> bool:
+        """
+        Read one line typed by the user and send it as a query.
+
+        Args:
+            conn (socket.socket): Active socket connection.
+
+        Returns:
+            bool: False once the session should end, True otherwise.
+        """
+        line = sys.stdin.readline()
+        if not line:
+            return False
+
+        query = line.strip()
+        if not query:
+            self._prompt()
+            return True
+        if query.lower() in {"exit", "quit"}:
+            print("Exiting client...")
+            return False
+
+        send_msg(conn, query.encode("utf-8"))
+        return True
+
+    def _on_server(self, conn: socket.socket) -> bool:
+        """
+        Receive and print every message the server has sent.
+
+        Args:
+            conn (socket.socket): Active socket connection.
+
+        Returns:
+            bool: False once the session should end, True otherwise.
+        """
+        while True:
+            data = recv_msg(conn)
+            if data is None:
+                print("\nServer closed the connection.")
+                return False
+
+            message = data.decode("utf-8")
+            if "__TIMEOUT__" in message:
+                print("\nConnection expired! Restart the client.")
+                return False
+
+            parts = message.split("\n", 1)
+            print(f"Server Response: {parts[0]}")
+            if len(parts) > 1:
+                print(parts[1])
+
+            # Decrypted bytes already buffered by TLS never wake the
+            # selector, so drain them here
+            if not (isinstance(conn, ssl.SSLSocket) and conn.pending()):
+                self._prompt()
+                return True
 
     def send_query_over_socket(
         self, s: socket.socket, query: str
@@ -153,12 +147,14 @@ class FileSearchClient:
                 Response time in seconds and server response.
         """
         try:
-            start_time = time.time()
-            s.sendall(query.encode("utf-8"))
-            data = s.recv(4096)
-            latency = time.time() - start_time
+            start_ns = time.perf_counter_ns()
+            send_msg(s, query.encode("utf-8"))
+            data = recv_msg(s)
+            latency = (time.perf_counter_ns() - start_ns) / 1e9
             response = (
-                data.decode("utf-8") if data else "Server closed connection."
+                data.decode("utf-8")
+                if data is not None
+                else "Server closed connection."
             )
             logger.info("Server Response: %s", response)
             return latency, response
@@ -175,21 +171,26 @@ class FileSearchClient:
             print("Failed to connect to server.")
             return
 
-        stop_event = threading.Event()
-        response_queue: queue.Queue[str] = queue.Queue()
-
-        listener_thread = self._setup_listener(
-            conn, stop_event, response_queue
-        )
+        # One thread waits on both the keyboard and the server
+        selector = selectors.DefaultSelector()
+        selector.register(sys.stdin, selectors.EVENT_READ, self._on_stdin)
+        selector.register(conn, selectors.EVENT_READ, self._on_server)
 
         try:
-            conn.connect((self.host, self.port))
-            self._handle_user_input(conn, stop_event, response_queue)
+            self._prompt()
+            running = True
+            while running:
+                for key, _ in selector.select(timeout=1.0):
+                    callback: Callable[[socket.socket], bool] = key.data
+                    if not callback(conn):
+                        running = False
+                        break
+        except KeyboardInterrupt:
+            print("\nInterrupted by user. Exiting.")
         except (OSError, ValueError) as e:
             logger.error("Error during interactive session: %s", e)
         finally:
-            stop_event.set()
-            listener_thread.join(timeout=0.5)
+            selector.close()
             # pylint: disable=broad-exception-caught
             try:
                 conn.shutdown(socket.SHUT_RDWR)
@@ -204,8 +205,6 @@ class FileSearchClient:
             finally:
                 conn.close()
                 logger.info("Connection closed.")
-            conn.close()
-            logger.info("Connection closed.")
 
 
 if __name__ == "__main__":
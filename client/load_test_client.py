@@ -1,22 +1,50 @@
 """Load test client module for benchmarking server performance."""
 
-import socket
+import asyncio
 import ssl
 import time
-import threading
-import csv
 from pathlib import Path
 from typing import List, Tuple, Optional
+
+import numpy as np
+
 from core.logger import logger
 from core.config_loader import get_config_value
+from core.framing import frame, read_msg
+from core.protocol import HELLO_BINARY, STATUS_NAMES, unpack_reply
+from core.ssl_cache import client_ssl_context
 from config.settings import CONFIG_FILE_PATH
 
+# Connected asyncio reader/writer pair
+Stream = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+# Average, p50, p95 and p99 latency in milliseconds
+LatencyStats = Tuple[float, float, float, float]
+
+
+def summarize_latencies(latencies: np.ndarray) -> LatencyStats:
+    """
+    Compute the mean and tail percentiles of latency samples.
+
+    Args:
+        latencies (np.ndarray): Successful query latencies in milliseconds.
+
+    Returns:
+        LatencyStats: Average, p50, p95 and p99 latency, all 0.0 when
+        there are no samples.
+    """
+    if latencies.size == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return float(latencies.mean()), float(p50), float(p95), float(p99)
+
 
 class BenchmarkClient:
     """
     Handle sending search queries to the server and measuring latency.
 
-    This client establishes connections and records response times.
+    This client keeps a pool of persistent connections and records
+    response times.
     """
 
     def __init__(self) -> None:
@@ -49,6 +77,10 @@ class BenchmarkClient:
             default="Stephen is overly talented",
         )
 
+        # Idle persistent streams. Only touched from the event loop
+        # thread, so no locking is needed.
+        self._streams: List[Stream] = []
+
     def supports_ssl(self) -> bool:
         """
         Check if SSL/TLS is enabled for the client.
@@ -58,61 +90,177 @@ class BenchmarkClient:
         """
         return self.ssl_config["enabled"]
 
-    def run_query(self, filename: str) -> Tuple[Optional[float], str]:
+    def _ssl_context(self) -> ssl.SSLContext:
         """
-        Send a search query to the server using mTLS.
+        Return the shared client-side mTLS context.
+
+        Returns:
+            ssl.SSLContext: Context presenting the client certificate and
+            verifying the server certificate.
+        """
+        return client_ssl_context(
+            self.ssl_config["client_cert"],
+            self.ssl_config["client_key"],
+            self.ssl_config["server_cert"],
+        )
+
+    @staticmethod
+    def _decode_reply(response: Optional[bytes]) -> str:
+        """
+        Decode a binary reply into the search result string.
 
         Args:
-            filename (str): File to search on the server.
+            response (Optional[bytes]): Reply payload, or None if the
+                server closed the connection.
 
         Returns:
-            Tuple[Optional[float], str]:
-                Response time in seconds and the server response or error.
+            str: The search result, or the server's text message when
+            the reply is not binary (such as an error).
+
+        Raises:
+            ConnectionResetError: If the server closed or expired the
+            connection, so it must not be reused.
         """
-        message = f"{filename}|{self.search_term}"
+        if response is None or response.startswith(b"__TIMEOUT__"):
+            raise ConnectionResetError("Server closed the connection.")
         try:
-            raw_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            meta = unpack_reply(response)
+        except ValueError:
+            return response.decode().strip()
+        return STATUS_NAMES.get(meta.status, "ERROR")
 
-            if self.ssl_config["ssl_enabled"]:
-                context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    async def _open_stream(self) -> Stream:
+        """
+        Open a new asyncio stream to the server, using mTLS when enabled.
 
-                # Load client-side certificate and private key
-                context.load_cert_chain(
-                    certfile=self.ssl_config["client_cert"],
-                    keyfile=self.ssl_config["client_key"],
-                )
+        The stream asks for binary replies, so no debug text has to be
+        formatted or parsed per query.
 
-                # Enforce mutual TLS authentication
-                context.verify_mode = ssl.CERT_REQUIRED
-                context.load_verify_locations(
-                    self.ssl_config["server_cert"]
-                )  # Validate server certificate
-
-                with context.wrap_socket(
-                    raw_socket, server_hostname=self.server_info["host"]
-                ) as sock:
-                    sock.settimeout(2)
-                    sock.connect(
-                        (self.server_info["host"], self.server_info["host"])
-                    )
-                    sock.sendall(message.encode())
-                    start = time.time()
-                    response = sock.recv(4096)
-                    end = time.time()
+        Returns:
+            Stream: Connected reader and writer pair.
+        """
+        if self.ssl_config["enabled"]:
+            connecting = asyncio.open_connection(
+                self.server_info["host"],
+                self.server_info["port"],
+                ssl=self._ssl_context(),
+                server_hostname=self.server_info["host"],
+            )
+        else:
+            connecting = asyncio.open_connection(
+                self.server_info["host"], self.server_info["port"]
+            )
+        stream = await asyncio.wait_for(connecting, timeout=2)
+        stream[1].write(frame(HELLO_BINARY))
+        return stream
+
+    @staticmethod
+    def _close_stream(stream: Stream) -> None:
+        """Close a stream that must not be reused."""
+        stream[1].close()
+
+    async def warm_up_async(self, connections: int) -> None:
+        """
+        Top up the idle stream pool so the first queries skip handshakes.
+
+        Args:
+            connections (int): Number of idle streams to keep ready.
+        """
+        missing = connections - len(self._streams)
+        if missing <= 0:
+            return
+        opened = await asyncio.gather(
+            *(self._open_stream() for _ in range(missing)),
+            return_exceptions=True,
+        )
+        for stream in opened:
+            if isinstance(stream, BaseException):
+                logger.error("Failed to pre-warm connection: %s", stream)
             else:
-                with raw_socket as sock:
-                    sock.settimeout(2)
-                    sock.connect(
-                        (self.server_info["host"], self.server_info["port"])
-                    )
-                    sock.sendall(message.encode())
-                    start = time.time()
-                    response = sock.recv(4096)
-                    end = time.time()
+                self._streams.append(stream)
+
+    def close_async(self) -> None:
+        """Close every idle pooled stream."""
+        while self._streams:
+            self._close_stream(self._streams.pop())
+
+    @staticmethod
+    async def send_query_async(
+        stream: Stream, message: str
+    ) -> Tuple[float, str]:
+        """
+        Send a query over an open stream and await the reply.
+
+        Args:
+            stream (Stream): Connected reader and writer pair.
+            message (str): Query payload.
+
+        Returns:
+            Tuple[float, str]: Response time in milliseconds and the
+            decoded server response.
 
-            return end - start, response.decode().strip()
+        Raises:
+            ConnectionResetError: If the server closed or expired the
+            connection, so it must not be reused.
+        """
+        reader, writer = stream
+        writer.write(frame(message.encode()))
+        await writer.drain()
+        start = time.perf_counter_ns()
+        response = await asyncio.wait_for(read_msg(reader), timeout=2)
+        end = time.perf_counter_ns()
+
+        return (end - start) / 1e6, BenchmarkClient._decode_reply(response)
+
+    async def run_query_async(
+        self, filename: str
+    ) -> Tuple[Optional[float], str]:
+        """
+        Send a search query on the event loop, reusing pooled streams.
+
+        A pooled persistent stream is reused when available so the
+        measured latency excludes the TCP and TLS handshakes, and many
+        queries can be in flight on a single thread. A stale stream is
+        replaced once before giving up.
+
+        Args:
+            filename (str): File to search on the server.
+
+        Returns:
+            Tuple[Optional[float], str]:
+                Response time in milliseconds and the server response
+                or error.
+        """
+        message = f"{filename}|{self.search_term}"
+        stream: Optional[Stream] = None
+        try:
+            stream = (
+                self._streams.pop()
+                if self._streams
+                else await self._open_stream()
+            )
+            try:
+                latency, response = await self.send_query_async(
+                    stream, message
+                )
+            except (ConnectionResetError, BrokenPipeError):
+                self._close_stream(stream)
+                stream = await self._open_stream()
+                latency, response = await self.send_query_async(
+                    stream, message
+                )
 
-        except (OSError, ssl.SSLError, ValueError) as e:
+            self._streams.append(stream)
+            return latency, response
+
+        except (
+            OSError,
+            ssl.SSLError,
+            ValueError,
+            asyncio.TimeoutError,
+        ) as e:
+            if stream is not None:
+                self._close_stream(stream)
             logger.error("SSL connection setup failed: %s", e)
             return None, f"ERROR: {e}"
 
@@ -172,59 +320,90 @@ class BenchmarkServer:
             f"ssl_enabled={self.ssl_config['enabled']})"
         )
 
-    def run(self) -> None:
-        """Benchmark server performance by simulating load."""
-        results = []
+    async def _run_level(
+        self, filename: str, qps: int
+    ) -> Tuple[LatencyStats, int]:
+        """
+        Dispatch queries at a fixed rate for one QPS level.
+
+        Each query runs as a task on the event loop, so in-flight queries
+        do not tie up OS threads. Sends are paced against absolute
+        deadlines so scheduling delays do not lower the effective rate.
 
-        for size in self.test_config["file_sizes"]:
-            size_filename = str(
-                Path(self.test_config["temp_file_dir"])
-                / f"test_file_{size}.txt"
+        Args:
+            filename (str): File to search on the server.
+            qps (int): Target queries per second.
+
+        Returns:
+            Tuple[LatencyStats, int]: Latency statistics in milliseconds
+            and the number of failed queries.
+        """
+        loop = asyncio.get_running_loop()
+        tasks: List[asyncio.Task[Tuple[Optional[float], str]]] = []
+        interval = 1.0 / qps
+        total = round(qps * self.test_config["duration_per_level"])
+        start_time = loop.time()
+
+        for i in range(total):
+            delay = start_time + i * interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(
+                asyncio.create_task(self.client.run_query_async(filename))
             )
-            print(f"\nTesting file size: {size} bytes")
-
-            for qps in range(
-                self.test_config["qps_range"][0],
-                self.test_config["qps_range"][1] + 1,
-            ):
-                print(f"  QPS {qps} -> ", end="")
-
-                latencies: list[float] = []
-                errors = 0
-                start_time = time.time()
-                end_time = start_time + self.test_config["duration_per_level"]
-                interval = 1.0 / qps
-
-                def query_thread(
-                    filename: str, latencies_list: List[float]
-                ) -> None:
-                    """Perform a query in a separate thread."""
-                    nonlocal errors
-                    latency, response = self.client.run_query(filename)
-                    if latency is not None:
-                        latencies_list.append(latency * 1000)
-                    else:
-                        errors += 1
-                        logger.error("Query error: %s", response)
-
-                threads = []
-
-                while time.time() < end_time:
-                    t = threading.Thread(
-                        target=query_thread, args=(size_filename, latencies)
-                    )
-                    t.start()
-                    threads.append(t)
-                    time.sleep(interval)
 
-                for t in threads:
-                    t.join()
+        latencies = np.empty(total, dtype=np.float64)
+        count = 0
+        for latency, response in await asyncio.gather(*tasks):
+            if latency is not None:
+                latencies[count] = latency
+                count += 1
+            else:
+                logger.error("Query error: %s", response)
+
+        return summarize_latencies(latencies[:count]), total - count
 
-                avg_latency = (
-                    sum(latencies) / len(latencies) if latencies else 0
+    async def _run_async(self) -> List[List]:
+        """
+        Run every file size and QPS level on a single event loop.
+
+        Returns:
+            List[List]: One [size, qps, avg_latency, errors] row per level.
+        """
+        results = []
+        max_qps = self.test_config["qps_range"][1]
+
+        try:
+            for size in self.test_config["file_sizes"]:
+                size_filename = str(
+                    Path(self.test_config["temp_file_dir"])
+                    / f"test_file_{size}.txt"
                 )
-                print(f"Latency: {avg_latency:.2f} ms, Errors: {errors}")
-                results.append([size, qps, avg_latency, errors])
+                print(f"\nTesting file size: {size} bytes")
+
+                for qps in range(
+                    self.test_config["qps_range"][0], max_qps + 1
+                ):
+                    print(f"  QPS {qps} -> ", end="")
+                    await self.client.warm_up_async(qps)
+
+                    stats, errors = await self._run_level(size_filename, qps)
+                    avg_latency, p50, p95, p99 = stats
+                    print(
+                        f"Latency: {avg_latency:.2f} ms "
+                        f"(p50 {p50:.2f}, p95 {p95:.2f}, p99 {p99:.2f}), "
+                        f"Errors: {errors}"
+                    )
+                    results.append(
+                        [size, qps, avg_latency, errors, p50, p95, p99]
+                    )
+        finally:
+            self.client.close_async()
+        return results
+
+    def run(self) -> None:
+        """Benchmark server performance by simulating load."""
+        results = asyncio.run(self._run_async())
         self.save_results(results)
 
     def save_results(self, results: List[List]) -> None:
@@ -236,12 +415,24 @@ class BenchmarkServer:
         )
         results_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with results_file.open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                ["File Size", "QPS", "Avg Latency (ms)", "Error Count"]
-            )
-            writer.writerows(results)
+        np.savetxt(
+            results_file,
+            np.asarray(results, dtype=np.float64).reshape(-1, 7),
+            delimiter=",",
+            fmt=["%d", "%d", "%.6f", "%d", "%.6f", "%.6f", "%.6f"],
+            header=",".join(
+                [
+                    "File Size",
+                    "QPS",
+                    "Avg Latency (ms)",
+                    "Error Count",
+                    "P50 Latency (ms)",
+                    "P95 Latency (ms)",
+                    "P99 Latency (ms)",
+                ]
+            ),
+            comments="",
+        )
 
         print(f"\nLoad test results written to: {results_file.resolve()}")
 
@@ -7,6 +7,7 @@ a YAML configuration file.
 
 # Standard library imports
 import os
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 # Third-party imports
@@ -15,6 +16,34 @@ import yaml
 # Local project imports
 from core.logger import logger
 
+# Directory containing the `core` package, which relative paths resolve to
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_TRUE_STRINGS = frozenset({"true", "yes", "1"})
+_FALSE_STRINGS = frozenset({"false", "no", "0"})
+_PATH_SUFFIXES = (".crt", ".key", ".txt", ".csv")
+
+
+@lru_cache(maxsize=4)
+def _load_config(config_file_path: str, _mtime_ns: int) -> dict[str, Any]:
+    """
+    Read, parse and pre-resolve the YAML configuration file.
+
+    The modification time is part of the cache key, so an edited file is
+    parsed again while repeated lookups reuse the cached dictionary.
+
+    Args:
+        config_file_path (str): Path to the YAML configuration file.
+        _mtime_ns (int): Modification time of the file, used as cache key.
+
+    Returns:
+        dict[str, Any]: Parsed configuration values. Shared between
+        callers and must not be mutated.
+    """
+    with open(config_file_path, "r", encoding="utf-8") as config_file:
+        config = yaml.safe_load(config_file) or {}
+    return {key: parse_config_value(value) for key, value in config.items()}
+
 
 def get_config_value(
     config_file_path: str, key: str, default: Optional[Any] = None
@@ -33,10 +62,9 @@ def get_config_value(
         or the default value when an error occurs.
     """
     try:
-        with open(config_file_path, "r", encoding="utf-8") as config_file:
-            config = yaml.safe_load(config_file)
-            value = config.get(key, default)
-            return parse_config_value(value)
+        config = _load_config(
+            config_file_path, os.stat(config_file_path).st_mtime_ns
+        )
     except (
         OSError,
         yaml.YAMLError,
@@ -44,6 +72,10 @@ def get_config_value(
         logger.error("Failed to read config: %s", e)
         return default
 
+    if key in config:
+        return config[key]
+    return parse_config_value(default)
+
 
 def parse_config_value(value: Any) -> Union[str, bool, Any]:
     """
@@ -57,18 +89,28 @@ def parse_config_value(value: Any) -> Union[str, bool, Any]:
         absolute file path, or the unchanged value.
     """
     if isinstance(value, str):
-        lowered = value.lower()
-        if lowered in ["true", "yes", "1"]:
-            return True
-        if lowered in [
-            "false",
-            "no",
-            "0",
-        ]:
-            return False
-        if value.endswith((".crt", ".key", ".txt", ".csv")):
-            # Resolve to absolute path inside project
-            project_root = os.path.dirname(os.path.abspath(__file__))
-            abs_path = os.path.abspath(os.path.join(project_root, "..", value))
-            return abs_path
+        return _parse_string(value)
+    return value
+
+
+@lru_cache(maxsize=256)
+def _parse_string(value: str) -> Union[str, bool]:
+    """
+    Convert a string config value to a boolean or an absolute path.
+
+    Args:
+        value (str): Raw string value.
+
+    Returns:
+        Union[str, bool]: The boolean, the path resolved against the
+        project root, or the unchanged string.
+    """
+    lowered = value.lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+    if value.endswith(_PATH_SUFFIXES):
+        # Resolve to absolute path inside project
+        return os.path.normpath(os.path.join(_PROJECT_ROOT, value))
     return value
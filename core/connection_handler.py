@@ -5,10 +5,12 @@ Manages client communication, search execution, and response handling.
 """
 
 # Standard library imports
+import asyncio
+import logging
 import socket
 import time
 from datetime import datetime
-from typing import Tuple, Type
+from typing import Any, Tuple, Type
 from socket import timeout as socket_timeout
 
 # Local project imports
@@ -17,6 +19,8 @@ from config.settings import CONFIG_FILE_PATH
 # Core module imports
 from core.logger import logger
 from core.config_loader import get_config_value
+from core.framing import frame, read_msg, recv_msg, send_msg
+from core.protocol import HELLO_BINARY, HELLO_INTERACTIVE, pack_reply
 
 # Search algorithm imports
 from core.search_algorithms.protocols import SearchProtocol
@@ -27,6 +31,8 @@ from core.search_algorithms.regex_line_search import RegexLineSearcher
 from core.search_algorithms.trie_search import TrieBasedSearcher
 from core.search_algorithms.cached_line_search import CachedLineSearcher
 from core.search_algorithms.set_based_searcher import SetBasedSearcher
+from core.search_algorithms.c_mmap_search import CMmapSearcher
+from core.search_algorithms.aho_corasick_search import AhoCorasickSearcher
 
 # Mapping of algorithm names to classes.
 # We maintain the entire dictionary for easy swithing.
@@ -39,6 +45,33 @@ SEARCH_CLASSES: dict[str, Type[SearchProtocol]] = {
     "trie": TrieBasedSearcher,
     "cached": CachedLineSearcher,
     "set": SetBasedSearcher,
+    "c_mmap": CMmapSearcher,
+    "aho_corasick": AhoCorasickSearcher,
+}
+
+# Stable one-byte algorithm identifiers for binary replies
+ALGORITHM_IDS: dict[str, int] = {
+    name: algorithm_id for algorithm_id, name in enumerate(SEARCH_CLASSES)
+}
+
+# One shared searcher per algorithm, so caches built by one connection
+# serve every later connection. Searchers only mutate plain attributes
+# and dicts, whose individual updates are atomic under the GIL.
+SEARCHERS: dict[str, SearchProtocol] = {
+    name: searcher_cls() for name, searcher_cls in SEARCH_CLASSES.items()
+}
+
+# Per-connection settings, read once at import so that accepting a
+# client does no config file IO.
+SERVER_SETTINGS: dict[str, Any] = {
+    "client_timeout_time": get_config_value(
+        CONFIG_FILE_PATH, "client_timeout_time", default=15
+    ),
+    "linuxpath": get_config_value(CONFIG_FILE_PATH, "linuxpath"),
+    "reread": get_config_value(CONFIG_FILE_PATH, "reread", default=True),
+    "search_algorithm": get_config_value(
+        CONFIG_FILE_PATH, "search_algorithm", default="mmap"
+    ),
 }
 
 
@@ -60,19 +93,18 @@ class ClientHandler:
         """
         self.client_socket = client_socket
         self.client_address = client_address
-        self.timeout = get_config_value(
-            CONFIG_FILE_PATH, "client_timeout_time", default=15
-        )
-        self.file_path = get_config_value(CONFIG_FILE_PATH, "linuxpath")
-        self.reread_on_query = get_config_value(
-            CONFIG_FILE_PATH, "reread", default=True
-        )
-        self.algorithm_name = get_config_value(
-            CONFIG_FILE_PATH, "search_algorithm", default="mmap"
-        )
-        self.searcher: SearchProtocol = SEARCH_CLASSES.get(
-            "mmap", MmapSearcher
-        )()
+        self.timeout = SERVER_SETTINGS["client_timeout_time"]
+        self.file_path = SERVER_SETTINGS["linuxpath"]
+        self.reread_on_query = SERVER_SETTINGS["reread"]
+        self.algorithm_name = SERVER_SETTINGS["search_algorithm"]
+        searcher = SEARCHERS.get(self.algorithm_name)
+        if searcher is None:
+            logger.warning(
+                "Unknown search algorithm %r, falling back to mmap.",
+                self.algorithm_name,
+            )
+            searcher = SEARCHERS["mmap"]
+        self.searcher: SearchProtocol = searcher
 
     def __repr__(self) -> str:
         """
@@ -86,23 +118,98 @@ class ClientHandler:
         return f"ClientHandler({self.client_address})"
 
     def _send_to_client(self, message: str) -> None:
-        """Send a message to the client using UTF-8 encoding."""
+        """Send a framed message to the client using UTF-8 encoding."""
+        self._send_bytes(message.encode("utf-8"))
+
+    def _send_bytes(self, payload: bytes) -> None:
+        """Send a framed binary payload to the client."""
         try:
-            self.client_socket.send(message.encode("utf-8"))
+            send_msg(self.client_socket, payload)
         except (socket.error, BrokenPipeError) as e:
             logger.debug(
                 "Failed to send message to %s: %s", self.client_address, e
             )
 
-    def _process_query(self, query: str) -> Tuple[str, float]:
-        """Execute search and return result with execution time."""
-        start_time = time.time()
+    def _process_query(self, query: str) -> Tuple[str, int]:
+        """Execute search and return result with execution time in ns."""
+        start_time = time.perf_counter_ns()
         result = self.searcher.search(
             self.file_path, query, self.reread_on_query
         )
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter_ns() - start_time
         return result, elapsed_time
 
+    def _reply_payload(
+        self, query: str, response: str, exec_time_ns: int, binary: bool
+    ) -> bytes:
+        """
+        Build the search response in the format the client asked for.
+
+        Binary clients get fixed-layout metadata; interactive clients get
+        the response followed by a human-readable debug line.
+
+        Args:
+            query (str): The search query.
+            response (str): The search result.
+            exec_time_ns (int): Search execution time in nanoseconds.
+            binary (bool): Whether the client asked for binary replies.
+
+        Returns:
+            bytes: The unframed reply payload.
+        """
+        if binary:
+            return pack_reply(
+                time.time_ns(),
+                exec_time_ns,
+                ALGORITHM_IDS.get(self.algorithm_name, 255),
+                response,
+                query.encode("utf-8"),
+            )
+
+        # Debug info is part of the reply shown to the client
+        debug_info = (
+            f"DEBUG: Timestamp: {datetime.now().isoformat()}, "
+            f"Search Query: {query}, "
+            f"IP: {self.client_address}, "
+            f"Response: {response}, "
+            f"Algorithm: {self.algorithm_name}, "
+            f"Execution Time: {exec_time_ns / 1e9:.6f} seconds"
+        )
+        return f"{response}\n{debug_info}".encode("utf-8")
+
+    def _answer(self, data: bytes, binary: bool) -> bytes:
+        """
+        Run the search for one received query and build its reply.
+
+        Args:
+            data (bytes): The raw query message.
+            binary (bool): Whether the client asked for binary replies.
+
+        Returns:
+            bytes: The unframed reply payload.
+
+        Raises:
+            ValueError: If the query is not valid UTF-8.
+        """
+        query = data.decode("utf-8").strip()
+        response, exec_time_ns = self._process_query(query)
+        payload = self._reply_payload(query, response, exec_time_ns, binary)
+
+        # Log it separately; the record carries its own timestamp. The
+        # guard skips building the call's arguments on every query when
+        # DEBUG is disabled, as it is by default
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Search Query: %s, IP: %s, Response: %s, "
+                "Algorithm: %s, Execution Time: %.6f seconds",
+                query,
+                self.client_address,
+                response,
+                self.algorithm_name,
+                exec_time_ns / 1e9,
+            )
+        return payload
+
     def handle(self) -> None:
         """
         Handle client requests.
@@ -113,38 +220,27 @@ class ClientHandler:
         logger.debug("New connection from %s", self.client_address)
         self.client_socket.settimeout(self.timeout)
 
+        first_message = True
+        binary_replies = False
         try:
             while True:
                 try:
-                    data = self.client_socket.recv(1024)
-                    if not data:
+                    data = recv_msg(self.client_socket)
+                    if data is None:
                         logger.info(
                             "Client %s closed the connection.",
                             self.client_address,
                         )
                         break
 
-                    query = data.decode("utf-8").strip()
-                    response, exec_time = self._process_query(query)
-
-                    # Build debug info
-                    debug_info = (
-                        f"DEBUG: Timestamp: {datetime.now().isoformat()}, "
-                        f"Search Query: {query}, "
-                        f"IP: {self.client_address}, "
-                        f"Response: {response}, "
-                        f"Algorithm: {self.algorithm_name}, "
-                        f"Execution Time: {exec_time:.6f} seconds"
-                    )
-
-                    # Combine the search response and debug info
-                    full_response = f"{response}\n{debug_info}"
+                    # An optional one-byte hello picks the reply format
+                    if first_message:
+                        first_message = False
+                        if data in (HELLO_BINARY, HELLO_INTERACTIVE):
+                            binary_replies = data == HELLO_BINARY
+                            continue
 
-                    # Send the full response to the client
-                    self._send_to_client(full_response)
-
-                    # Log it to the server logs separately
-                    logger.debug(debug_info)
+                    self._send_bytes(self._answer(data, binary_replies))
 
                 except socket_timeout:
                     logger.info(
@@ -164,3 +260,98 @@ class ClientHandler:
         finally:
             self.client_socket.close()
             logger.debug("Connection with %s closed.", self.client_address)
+
+
+class AsyncClientHandler(ClientHandler):
+    """
+    Handle a client connected through asyncio streams.
+
+    Speaks the same protocol as ClientHandler on an event loop, so one
+    thread can serve many idle connections; searches run in the loop's
+    default executor so a slow query does not stall other clients.
+    """
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Initialize AsyncClientHandler with the client's streams.
+
+        Args:
+            reader (asyncio.StreamReader): Stream of client messages.
+            writer (asyncio.StreamWriter): Stream of replies.
+        """
+        super().__init__(
+            writer.get_extra_info("socket"),
+            writer.get_extra_info("peername"),
+        )
+        self.reader = reader
+        self.writer = writer
+
+    async def _write(self, payload: bytes) -> None:
+        """Send a framed payload, ignoring clients that went away."""
+        try:
+            self.writer.write(frame(payload))
+            await self.writer.drain()
+        except (ConnectionError, OSError) as e:
+            logger.debug(
+                "Failed to send message to %s: %s", self.client_address, e
+            )
+
+    async def handle_async(self) -> None:
+        """
+        Handle client requests until the client leaves or idles out.
+
+        Mirrors ClientHandler.handle: an optional hello picks the reply
+        format, each query gets one reply, and idle clients are told why
+        they are disconnected.
+        """
+        logger.debug("New connection from %s", self.client_address)
+        loop = asyncio.get_running_loop()
+
+        first_message = True
+        binary_replies = False
+        try:
+            while True:
+                try:
+                    data = await asyncio.wait_for(
+                        read_msg(self.reader), self.timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.info(
+                        "Client %s idle for too long. Disconnecting",
+                        self.client_address,
+                    )
+                    await self._write(
+                        b"__TIMEOUT__: Server disconnected due to inactivity."
+                    )
+                    break
+                if data is None:
+                    logger.info(
+                        "Client %s closed the connection.",
+                        self.client_address,
+                    )
+                    break
+
+                # An optional one-byte hello picks the reply format
+                if first_message:
+                    first_message = False
+                    if data in (HELLO_BINARY, HELLO_INTERACTIVE):
+                        binary_replies = data == HELLO_BINARY
+                        continue
+
+                payload = await loop.run_in_executor(
+                    None, self._answer, data, binary_replies
+                )
+                await self._write(payload)
+        except (ConnectionError, ValueError, OSError) as e:
+            logger.error(
+                "Error handling client %s: %s", self.client_address, e
+            )
+            await self._write(f"ERROR: {str(e)}".encode("utf-8"))
+        finally:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
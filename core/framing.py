@@ -0,0 +1,171 @@
+"""
+Message framing.
+
+Prefixes every message with its length as a 4-byte big-endian integer so
+that a receiver always reads exactly one whole message, however TCP or
+TLS splits it, and several messages can share one connection.
+"""
+
+import asyncio
+import socket
+import ssl
+import struct
+import threading
+from typing import Optional
+
+# 4-byte big-endian payload length
+HEADER = struct.Struct(">I")
+
+# Largest payload accepted, guarding against corrupt or hostile headers
+MAX_FRAME_SIZE = 1 << 20
+
+# Largest receive buffer a thread keeps for reuse; bigger messages get a
+# buffer of their own so one large frame does not pin its memory
+_SCRATCH_SIZE = 64 << 10
+
+_scratch = threading.local()
+
+
+def frame(payload: bytes) -> bytes:
+    """
+    Prefix a payload with its length header.
+
+    Args:
+        payload (bytes): Message body.
+
+    Returns:
+        bytes: Header followed by the payload.
+    """
+    return HEADER.pack(len(payload)) + payload
+
+
+def send_msg(sock: socket.socket, payload: bytes) -> None:
+    """
+    Send one framed message.
+
+    Args:
+        sock (socket.socket): Connected socket.
+        payload (bytes): Message body.
+    """
+    sock.sendall(frame(payload))
+
+
+def _lease(size: int) -> bytearray:
+    """
+    Return a buffer of at least `size` bytes to receive into.
+
+    Each thread reuses one buffer across messages, so receiving does not
+    allocate for every header and payload.
+
+    Args:
+        size (int): Number of bytes needed.
+
+    Returns:
+        bytearray: The calling thread's buffer, or a fresh one for sizes
+        beyond _SCRATCH_SIZE.
+    """
+    if size > _SCRATCH_SIZE:
+        return bytearray(size)
+    buffer = getattr(_scratch, "buffer", None)
+    if buffer is None:
+        buffer = _scratch.buffer = bytearray(_SCRATCH_SIZE)
+    return buffer
+
+
+def _recvn(sock: socket.socket, size: int) -> Optional[memoryview]:
+    """
+    Receive exactly `size` bytes into a reused buffer.
+
+    Plain TCP sockets ask the kernel to wait for the whole read with
+    MSG_WAITALL; TLS sockets do not accept flags and loop instead.
+
+    Args:
+        sock (socket.socket): Connected socket.
+        size (int): Number of bytes to read.
+
+    Returns:
+        Optional[memoryview]: The bytes read, or None if the peer closed
+        the connection before sending any of them. The view is only valid
+        until the thread's next receive.
+
+    Raises:
+        ConnectionError: If the peer closed the connection mid-message.
+    """
+    view = memoryview(_lease(size))[:size]
+    flags = 0
+    if not isinstance(sock, ssl.SSLSocket):
+        flags = getattr(socket, "MSG_WAITALL", 0)
+
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received, flags)
+        if not count:
+            if received == 0:
+                return None
+            raise ConnectionError("Connection closed mid-message.")
+        received += count
+    return view
+
+
+def recv_msg(sock: socket.socket) -> Optional[bytes]:
+    """
+    Receive one framed message.
+
+    Args:
+        sock (socket.socket): Connected socket.
+
+    Returns:
+        Optional[bytes]: The message body, or None if the peer closed the
+        connection cleanly between messages.
+
+    Raises:
+        ConnectionError: If the peer closed the connection mid-message.
+        ValueError: If the announced size exceeds MAX_FRAME_SIZE.
+    """
+    header = _recvn(sock, HEADER.size)
+    if header is None:
+        return None
+
+    # Unpacked before the payload reuses the buffer
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {size} bytes exceeds the size limit.")
+    if size == 0:
+        return b""
+
+    payload = _recvn(sock, size)
+    if payload is None:
+        raise ConnectionError("Connection closed mid-message.")
+    return bytes(payload)
+
+
+async def read_msg(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Receive one framed message from an asyncio stream.
+
+    Args:
+        reader (asyncio.StreamReader): Stream connected to the peer.
+
+    Returns:
+        Optional[bytes]: The message body, or None if the peer closed the
+        connection cleanly between messages.
+
+    Raises:
+        ConnectionError: If the peer closed the connection mid-message.
+        ValueError: If the announced size exceeds MAX_FRAME_SIZE.
+    """
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise ConnectionError("Connection closed mid-message.") from e
+
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {size} bytes exceeds the size limit.")
+
+    try:
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError as e:
+        raise ConnectionError("Connection closed mid-message.") from e
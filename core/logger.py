@@ -1,14 +1,85 @@
 """
 Logger configuration module.
 
-Sets up logging with a predefined format and debug level.
+Sets up the project logger at INFO level. Records are handed to a queue
+and written to stderr, or to a log file once the server detaches, by a
+background listener thread, so logging from a request thread never waits
+on the stream lock or the write itself.
 """
 
+import atexit
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
+_LOG_FORMAT = "%(asctime)s - %(message)s"
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(message)s",
-)
-logger = logging.getLogger()
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+# File the listener writes records to; None for stderr
+_log_path: Optional[str] = None  # pylint: disable=invalid-name
+
+
+def _start_listener() -> QueueListener:
+    """
+    Start a listener thread writing queued records to the log output.
+
+    Returns:
+        QueueListener: The running listener.
+    """
+    handler: logging.Handler
+    if _log_path is None:
+        handler = logging.StreamHandler()
+    else:
+        # Opened on the first record, in the process that writes it
+        handler = logging.FileHandler(_log_path, encoding="utf-8", delay=True)
+    handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    queue_listener = QueueListener(_log_queue, handler)
+    queue_listener.start()
+    return queue_listener
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+
+
+def _restart_listener() -> None:
+    """Start a fresh listener thread, such as in both sides of a fork."""
+    global _listener  # pylint: disable=global-statement
+    _listener = _start_listener()
+
+
+def log_to_file(path: str) -> None:
+    """
+    Write log records to a file instead of stderr from now on.
+
+    Args:
+        path (str): Log file, appended to and created if missing.
+    """
+    global _log_path  # pylint: disable=global-statement
+    _log_path = path
+    _stop_listener()
+    _restart_listener()
+
+
+_listener = _start_listener()
+atexit.register(_stop_listener)
+if hasattr(os, "register_at_fork"):
+    # Threads do not survive a fork, and records still queued would be
+    # written twice, so drain and stop the listener first
+    os.register_at_fork(
+        before=_stop_listener,
+        after_in_parent=_restart_listener,
+        after_in_child=_restart_listener,
+    )
+
+# Named logger, so the root logger and other libraries are left alone
+logger = logging.getLogger("ssl_server")
+logger.setLevel(logging.INFO)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
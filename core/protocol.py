@@ -0,0 +1,96 @@
+"""
+Wire protocol.
+
+Defines the optional one-byte client hello that selects the reply format,
+and the fixed-layout binary metadata sent to machine clients instead of
+the human-readable debug text.
+"""
+
+import struct
+from typing import NamedTuple
+
+# Payload of a one-byte hello frame sent before the first query
+HELLO_INTERACTIVE = b"\x01"
+HELLO_BINARY = b"\x02"
+
+# timestamp_ns, exec_time_ns, algorithm id, status code, query length,
+# followed by the query bytes; the length is as wide as a frame's, so any
+# query that can be received can be echoed
+REPLY_META = struct.Struct(">QQBBI")
+
+# Status codes for the search results; anything else is an error
+STATUS_CODES: dict[str, int] = {
+    "STRING EXISTS": 0,
+    "STRING NOT FOUND": 1,
+    "FILE NOT FOUND": 2,
+}
+STATUS_ERROR = 3
+STATUS_NAMES: dict[int, str] = {
+    code: name for name, code in STATUS_CODES.items()
+}
+
+
+class ReplyMeta(NamedTuple):
+    """Decoded binary reply metadata."""
+
+    timestamp_ns: int
+    exec_time_ns: int
+    algorithm_id: int
+    status: int
+    query: bytes
+
+
+def pack_reply(
+    timestamp_ns: int,
+    exec_time_ns: int,
+    algorithm_id: int,
+    response: str,
+    query: bytes,
+) -> bytes:
+    """
+    Serialize a search reply for a binary client.
+
+    Args:
+        timestamp_ns (int): Wall-clock time of the reply in nanoseconds.
+        exec_time_ns (int): Search execution time in nanoseconds.
+        algorithm_id (int): Identifier of the search algorithm used.
+        response (str): Search result string.
+        query (bytes): Encoded search query.
+
+    Returns:
+        bytes: Fixed-size metadata followed by the query.
+    """
+    return (
+        REPLY_META.pack(
+            timestamp_ns,
+            exec_time_ns,
+            algorithm_id,
+            STATUS_CODES.get(response, STATUS_ERROR),
+            len(query),
+        )
+        + query
+    )
+
+
+def unpack_reply(payload: bytes) -> ReplyMeta:
+    """
+    Deserialize a binary search reply.
+
+    Args:
+        payload (bytes): Reply produced by `pack_reply`.
+
+    Returns:
+        ReplyMeta: The decoded fields.
+
+    Raises:
+        ValueError: If the payload is not a well-formed binary reply.
+    """
+    if len(payload) < REPLY_META.size:
+        raise ValueError("Reply is shorter than its metadata.")
+    timestamp_ns, exec_time_ns, algorithm_id, status, query_len = (
+        REPLY_META.unpack_from(payload)
+    )
+    query = payload[REPLY_META.size:]
+    if len(query) != query_len:
+        raise ValueError("Reply query length does not match its metadata.")
+    return ReplyMeta(timestamp_ns, exec_time_ns, algorithm_id, status, query)
@@ -0,0 +1,162 @@
+"""
+Aho-Corasick search algorithm.
+
+Indexes the stripped file lines in a `pyahocorasick` automaton, a trie
+implemented in C, so the index is built and queried without per-node
+Python objects. When the extension is not installed, the lines are held
+in a frozenset instead.
+"""
+
+import os
+from typing import Any, Container, Iterable, Optional
+
+from .protocols import SearchProtocol
+from .sequential_io import open_sequential
+
+from ..logger import logger
+
+# Prepended to every key: the automaton cannot store an empty word, but
+# an empty line must still match an empty query. No line contains it.
+_KEY_PREFIX = "\n"
+
+
+def _load_automaton_type() -> Optional[Any]:
+    """
+    Look up the `pyahocorasick` automaton class.
+
+    Returns:
+        Optional[Any]: The `Automaton` class, or None when the extension
+        is not installed.
+    """
+    try:
+        import ahocorasick  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return ahocorasick.Automaton
+
+
+# Falls back to a frozenset when unavailable
+_AUTOMATON = _load_automaton_type()
+
+
+def _build_index(lines: Iterable[str]) -> Container[str]:
+    """
+    Index prefixed lines for exact lookups.
+
+    Args:
+        lines (Iterable[str]): Stripped, decoded lines of the file.
+
+    Returns:
+        Container[str]: An automaton holding the prefixed lines, or a
+        frozenset of them when `pyahocorasick` is unavailable.
+    """
+    keys = (_KEY_PREFIX + line for line in lines)
+    if _AUTOMATON is None:
+        return frozenset(keys)
+
+    automaton = _AUTOMATON()
+    for key in keys:
+        automaton.add_word(key, True)
+    return automaton
+
+
+class AhoCorasickSearcher(SearchProtocol):
+    """
+    Perform full-line searches over a C-level trie of the file lines.
+
+    Every query is answered by the same automaton, which is rebuilt only
+    when the file changes on disk or a reread is requested.
+
+    Attributes:
+        index (Optional[Container[str]]): Indexed lines of the file.
+        loaded_key (Optional[tuple[str, int, int]]): Path, modification
+        time and size of the indexed file.
+    """
+
+    def __init__(self) -> None:
+        """Initialize AhoCorasickSearcher with an empty index."""
+        self.index: Optional[Container[str]] = None
+        self.loaded_key: Optional[tuple[str, int, int]] = None
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the AhoCorasickSearcher instance.
+
+        Returns:
+            str: A formatted string describing the index backend and file.
+        """
+        backend = "frozenset" if _AUTOMATON is None else "automaton"
+        loaded = self.loaded_key[0] if self.loaded_key else None
+        return f"AhoCorasickSearcher(index={backend}, loaded_file={loaded})"
+
+    def supports_caching(self) -> bool:
+        """
+        Indicate whether the search algorithm supports caching.
+
+        Returns:
+            bool: True if caching is supported, False otherwise.
+        """
+        return True
+
+    def _preload_file(
+        self, filepath: str, reread_on_query: bool
+    ) -> Container[str]:
+        """
+        Return the index for a file, building it only when needed.
+
+        Args:
+            filepath (str): Path to the file to index.
+            reread_on_query (bool): If True, always rebuild from disk.
+
+        Returns:
+            Container[str]: Indexed lines of the file.
+        """
+        info = os.stat(filepath)
+        key = (filepath, info.st_mtime_ns, info.st_size)
+        if (
+            not reread_on_query
+            and self.index is not None
+            and self.loaded_key == key
+        ):
+            return self.index
+
+        with open_sequential(filepath) as file:
+            data = file.read()
+        # Lines are stripped as bytes, matching the other searchers
+        index = _build_index(
+            line.strip().decode("utf-8", "surrogateescape")
+            for line in data.splitlines()
+        )
+        self.index, self.loaded_key = index, key
+        return index
+
+    def search(
+        self, filepath: str, search_string: str, reread_on_query: bool = False
+    ) -> str:
+        """
+        Search for an exact full-line match of a search_string.
+
+        Args:
+            filepath (str): Path to the file to search.
+            search_string (str): Exact line to look for in the file.
+            reread_on_query (bool): Whether to rebuild the index first.
+
+        Returns:
+            str: One of the following results:
+                - "STRING EXISTS" if the search_string is found.
+                - "STRING NOT FOUND" if not.
+                - "FILE NOT FOUND" if the file does not exist.
+                - "ERROR: <message>" if an exception occurs.
+        """
+        try:
+            index = self._preload_file(filepath, reread_on_query)
+            return (
+                "STRING EXISTS"
+                if _KEY_PREFIX + search_string in index
+                else "STRING NOT FOUND"
+            )
+        except FileNotFoundError:
+            return "FILE NOT FOUND"
+        except (OSError, ValueError) as e:
+            logger.error("AhoCorasickSearcher failed: %s", e)
+            return f"ERROR: {e}"
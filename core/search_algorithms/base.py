@@ -0,0 +1,90 @@
+"""
+Base class for file searchers.
+
+Implements the parts of `search` shared by searchers that look at the
+file's metadata before reading it: the file is stat'ed once, the result
+handed to the subclass with the query already encoded, and missing files
+and errors are reported in one place.
+"""
+
+import os
+
+from .protocols import SearchProtocol
+
+from ..logger import logger
+
+
+class BaseSearcher(SearchProtocol):
+    """
+    Template for searchers that answer a query from a single stat result.
+
+    Subclasses implement `_do_search`, which receives the stat result so
+    cache validation needs no further system calls, and returns whether
+    the search string was found.
+    """
+
+    def supports_caching(self) -> bool:
+        """
+        Indicate whether the search algorithm supports caching.
+
+        Returns:
+            bool: True if caching is supported, False otherwise.
+        """
+        return True
+
+    def _do_search(
+        self,
+        filepath: str,
+        info: os.stat_result,
+        needle: bytes,
+        reread_on_query: bool,
+    ) -> bool:
+        """
+        Search for a full-line match in an existing file.
+
+        Args:
+            filepath (str): Path to the file to search.
+            info (os.stat_result): Metadata of the file, taken just before.
+            needle (bytes): UTF-8 encoded line to look for in the file.
+            reread_on_query (bool): Whether to read the file again.
+
+        Returns:
+            bool: True if the needle is found, False otherwise.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file content cannot be processed.
+        """
+        raise NotImplementedError
+
+    def search(
+        self, filepath: str, search_string: str, reread_on_query: bool = False
+    ) -> str:
+        """
+        Search for an exact full-line match of a search_string.
+
+        Args:
+            filepath (str): Path to the file to search.
+            search_string (str): Exact line to look for in the file.
+            reread_on_query (bool): Whether changes on disk must be seen
+                by this query. Lines cached for the file are still used
+                while its modification time and size are unchanged.
+
+        Returns:
+            str: One of the following results:
+                - "STRING EXISTS" if the search_string is found.
+                - "STRING NOT FOUND" if not.
+                - "FILE NOT FOUND" if the file does not exist.
+                - "ERROR: <message>" if an exception occurs.
+        """
+        try:
+            info = os.stat(filepath)
+            # Encoded once here; every cache holds the lines as bytes
+            needle = search_string.encode("utf-8")
+            found = self._do_search(filepath, info, needle, reread_on_query)
+        except FileNotFoundError:
+            return "FILE NOT FOUND"
+        except (OSError, ValueError) as e:
+            logger.error("%s failed: %s", type(self).__name__, e)
+            return f"ERROR: {e}"
+        return "STRING EXISTS" if found else "STRING NOT FOUND"
@@ -3,9 +3,15 @@ Buffered chunk search algorithm.
 
 Implements a search method that processes files in fixed-size chunks
 to efficiently locate exact line matches without loading the entire file
-into memory.
+into memory. When the file is not reread on every query, it is memory
+mapped once and scanned in place instead.
 """
 
+import mmap
+import os
+from typing import Optional
+
+from .line_match import contains_line
 from .protocols import SearchProtocol
 
 # Local imports
@@ -25,6 +31,8 @@ class BufferedChunkSearcher(SearchProtocol):
         self.cached_results: dict[str, bool] = {}
         self.last_filepath: str | None = None
         self.last_search_string: str | None = None
+        self.mapped_file: Optional[mmap.mmap] = None
+        self.mapped_stat: Optional[tuple[str, int, int]] = None
 
     def __repr__(self) -> str:
         """
@@ -78,36 +86,98 @@ class BufferedChunkSearcher(SearchProtocol):
                 else "STRING NOT FOUND"
             )
 
-        # Number of bytes per read
-        buffer_size = 8192
-        remainder = ""
-
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                while True:
-                    chunk = f.read(buffer_size)
-                    if not chunk:
-                        break
-                    lines = (remainder + chunk).split("\n")
-                    remainder = lines.pop()
-                    for line in lines:
-                        if line.strip() == search_string:
-                            self._cache_result(filepath, search_string, True)
-                            return "STRING EXISTS"
-
-                if remainder and remainder.strip() == search_string:
-                    self._cache_result(filepath, search_string, True)
-                    return "STRING EXISTS"
-
-                self._cache_result(filepath, search_string, False)
-                return "STRING NOT FOUND"
-
+            needle = search_string.encode("utf-8")
+            if reread_on_query:
+                found = self._scan_chunks(filepath, needle)
+            else:
+                found = self._scan_mapped(filepath, needle)
         except FileNotFoundError:
             return "FILE NOT FOUND"
         except (OSError, ValueError) as e:
             logger.error("BufferedChunkSearcher failed: %s", e)
             return f"ERROR: {e}"
 
+        self._cache_result(filepath, search_string, found)
+        return "STRING EXISTS" if found else "STRING NOT FOUND"
+
+    def search_bytes(self, data: bytes, needle: bytes) -> str:
+        """
+        Search for an exact match of an encoded string in file content.
+
+        Args:
+            data (bytes): Raw content of the file.
+            needle (bytes): The exact string to search for, UTF-8 encoded.
+
+        Returns:
+            str: "STRING EXISTS" if found, "STRING NOT FOUND" otherwise.
+        """
+        found = contains_line(data, needle)
+        return "STRING EXISTS" if found else "STRING NOT FOUND"
+
+    def _scan_chunks(self, filepath: str, needle: bytes) -> bool:
+        """
+        Scan the file in fixed-size binary chunks.
+
+        Args:
+            filepath (str): Path to the file to search.
+            needle (bytes): Encoded search string.
+
+        Returns:
+            bool: True if a matching line is found, False otherwise.
+        """
+        # Number of bytes per read
+        buffer_size = 1 << 16
+        tail = bytearray()
+
+        with open(filepath, "rb") as f:
+            while True:
+                chunk = f.read(buffer_size)
+                if not chunk:
+                    break
+                tail += chunk
+                # Only complete lines are scanned; the partial last
+                # line is carried over to the next chunk, as is a final
+                # "\r" that the next chunk may pair with a "\n".
+                complete = (
+                    max(tail.rfind(b"\n"), tail.rfind(b"\r", 0, -1)) + 1
+                )
+                if contains_line(tail, needle, complete):
+                    return True
+                del tail[:complete]
+
+        return bool(tail) and contains_line(tail, needle)
+
+    def _scan_mapped(self, filepath: str, needle: bytes) -> bool:
+        """
+        Scan a memory map of the file, remapping only when it changed.
+
+        Args:
+            filepath (str): Path to the file to search.
+            needle (bytes): Encoded search string.
+
+        Returns:
+            bool: True if a matching line is found, False otherwise.
+        """
+        stat = os.stat(filepath)
+        if stat.st_size == 0:
+            return False
+
+        key = (filepath, stat.st_mtime_ns, stat.st_size)
+        # Read once: other threads may swap in a new map meanwhile, and
+        # this scan must keep using the one it started with
+        mapped = self.mapped_file
+        if mapped is None or self.mapped_stat != key:
+            with open(filepath, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            # The previous map is released once no search still uses it
+            self.mapped_file = mapped
+            self.mapped_stat = key
+
+        return contains_line(mapped, needle)
+
     def _cache_result(
         self, filepath: str, search_string: str, result: bool
     ) -> None:
@@ -0,0 +1,142 @@
+"""
+C-level memory-mapped search algorithm.
+
+Implements a search method that maps the file privately and locates the
+search string with the C library's `memmem`, called through `ctypes`, so
+the scan over the file runs entirely outside the Python interpreter.
+"""
+
+import ctypes
+import ctypes.util
+import mmap
+import os
+from typing import Any, Optional
+
+from .line_match import contains_line
+from .protocols import SearchProtocol
+
+from ..logger import logger
+
+
+def _load_memmem() -> Optional[Any]:
+    """
+    Look up `memmem` in the C library.
+
+    Returns:
+        Optional[Any]: The configured foreign function, or None when the
+        platform's C library does not provide it.
+    """
+    libc_name = ctypes.util.find_library("c")
+    if libc_name is None:
+        return None
+    try:
+        memmem = ctypes.CDLL(libc_name).memmem
+    except (OSError, AttributeError):
+        return None
+    memmem.restype = ctypes.c_void_p
+    memmem.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.c_char_p,
+        ctypes.c_size_t,
+    ]
+    return memmem
+
+
+# Falls back to `mmap.find` when unavailable
+_MEMMEM = _load_memmem()
+
+
+class CMmapSearcher(SearchProtocol):
+    """
+    Perform exact line searches with `memmem` over a private memory map.
+
+    Each occurrence of the search string is found in C and only the line
+    that encloses it is compared by `contains_line`, so most of the file
+    is never touched by the interpreter.
+    """
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the CMmapSearcher instance.
+
+        Returns:
+            str: A formatted string describing the searcher instance.
+        """
+        return f"CMmapSearcher(memmem={'libc' if _MEMMEM else 'fallback'})"
+
+    def supports_caching(self) -> bool:
+        """
+        Indicate whether the search algorithm supports caching.
+
+        Returns:
+            bool: True if caching is supported, False otherwise.
+        """
+        return False
+
+    def search(
+        self, filepath: str, search_string: str, _reread_on_query: bool = False
+    ) -> str:
+        """
+        Search for an exact match of a search_string in the file.
+
+        Args:
+            filepath (str): The path to the file to search.
+            search_string (str): The exact string to search for.
+            reread_on_query (bool): Whether to reread file (unused here,
+                the file is mapped on every query).
+
+        Returns:
+            str: One of the following strings
+                - "STRING EXISTS" if found
+                - "STRING NOT FOUND" if not
+                - "FILE NOT FOUND"
+                - "ERROR: <message>" on failure.
+        """
+        try:
+            needle = search_string.encode("utf-8")
+            with open(filepath, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return "STRING NOT FOUND"
+                # ACCESS_COPY maps MAP_PRIVATE, which ctypes can address
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+            with mapped:
+                found = self._contains_line(mapped, needle)
+            return "STRING EXISTS" if found else "STRING NOT FOUND"
+
+        except FileNotFoundError:
+            return "FILE NOT FOUND"
+        except (OSError, ValueError) as e:
+            logger.error("CMmapSearcher failed: %s", e)
+            return f"ERROR: {e}"
+
+    @staticmethod
+    def _contains_line(mapped: mmap.mmap, needle: bytes) -> bool:
+        """
+        Check whether a line of the map equals the needle once stripped.
+
+        Args:
+            mapped (mmap.mmap): Private memory map of the file.
+            needle (bytes): Encoded search string.
+
+        Returns:
+            bool: True if a matching line is found, False otherwise.
+        """
+        if _MEMMEM is None:
+            return contains_line(mapped, needle)
+
+        buffer = ctypes.c_char.from_buffer(mapped)
+        try:
+            base = ctypes.addressof(buffer)
+
+            def find(start: int, end: int) -> int:
+                if start > end:
+                    return -1
+                hit = _MEMMEM(base + start, end - start, needle, len(needle))
+                return -1 if hit is None else hit - base
+
+            return contains_line(mapped, needle, find=find)
+        finally:
+            # The exported buffer must be released before the map closes
+            del buffer
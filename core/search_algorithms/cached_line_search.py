@@ -2,12 +2,14 @@
 Cached line search algorithm.
 
 Implements a search method that caches file contents for efficient
-repeated queries.
+repeated queries. The stripped lines are cached in a frozenset, so a
+query is a single hash probe rather than a scan of the file.
 """
 
 from typing import Optional
 
 from .protocols import SearchProtocol
+from .sequential_io import open_sequential
 
 
 class CachedLineSearcher(SearchProtocol):
@@ -15,12 +17,12 @@ class CachedLineSearcher(SearchProtocol):
     Cache the contents of a file for efficient repeated queries.
 
     Attributes:
-        file_content (Optional[list[str]]): List of lines read from the file.
+        line_set (Optional[frozenset[bytes]]): Stripped lines of the file.
     """
 
     def __init__(self) -> None:
         """Initialize an empty file content cache."""
-        self.file_content: Optional[list[str]] = None
+        self.line_set: Optional[frozenset[bytes]] = None
 
     def __repr__(self) -> str:
         """
@@ -30,8 +32,8 @@ class CachedLineSearcher(SearchProtocol):
             str: A formatted string describing the instance state.
         """
         return (
-            f"CachedLineSearcher(file_content_size="
-            f"{len(self.file_content) if self.file_content else 0})"
+            f"CachedLineSearcher(line_set_size="
+            f"{len(self.line_set) if self.line_set else 0})"
         )
 
     def supports_caching(self) -> bool:
@@ -64,14 +66,17 @@ class CachedLineSearcher(SearchProtocol):
         """
         try:
             # Load or reload file content if needed
-            if reread_on_query or self.file_content is None:
-                with open(filepath, "r", encoding="utf-8") as file:
-                    self.file_content = file.readlines()
+            line_set = self.line_set
+            if reread_on_query or line_set is None:
+                with open_sequential(filepath) as file:
+                    data = file.read()
+                # Split like the other searchers: "\r" also ends a line
+                line_set = frozenset(map(bytes.strip, data.splitlines()))
+                self.line_set = line_set
 
             # Search for exact string match (stripped of whitespace)
-            for line in self.file_content:
-                if line.strip() == search_string:
-                    return "STRING EXISTS"
+            if search_string.encode("utf-8") in line_set:
+                return "STRING EXISTS"
             return "STRING NOT FOUND"
 
         except FileNotFoundError:
@@ -1,14 +1,26 @@
 """
 Line-by-line search algorithm.
 
-Implements a simple search method that scans a file one line at a time
-to find exact search_string matches.
+Implements a simple search method that finds exact search_string matches
+line by line. The file is memory mapped and scanned in C rather than
+decoded into one Python string per line. Files that cannot be mapped are
+streamed through a single reusable buffer instead.
 """
 
+import mmap
+import os
+import stat
+from typing import BinaryIO
+
+from .line_match import contains_line
 from .protocols import SearchProtocol
+from .sequential_io import open_sequential
 
 from ..logger import logger
 
+# Initial size of the streaming buffer; it only grows for longer lines
+_BUFFER_SIZE = 1 << 16
+
 
 class LineByLineSearcher(SearchProtocol):
     """
@@ -54,13 +66,82 @@ class LineByLineSearcher(SearchProtocol):
                 - "ERROR: <message>" on failure.
         """
         try:
-            with open(filepath, "r", encoding="utf-8") as file:
-                for line in file:
-                    if line.strip() == search_string:
-                        return "STRING EXISTS"
-            return "STRING NOT FOUND"
+            needle = search_string.encode("utf-8")
+            with open_sequential(filepath) as f:
+                info = os.fstat(f.fileno())
+                # Pipes and pseudo-files (which report a size of 0)
+                # cannot be mapped, so they are streamed
+                if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+                    found = self._scan_stream(f, needle)
+                else:
+                    with mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mapped:
+                        if hasattr(mapped, "madvise"):
+                            mapped.madvise(mmap.MADV_SEQUENTIAL)
+                        found = contains_line(mapped, needle)
+            return "STRING EXISTS" if found else "STRING NOT FOUND"
         except FileNotFoundError:
             return "FILE NOT FOUND"
         except (OSError, ValueError) as e:
             logger.error("LineByLineSearcher failed: %s", e)
             return f"ERROR: {e}"
+
+    def search_bytes(self, data: bytes, needle: bytes) -> str:
+        """
+        Search for an exact match of an encoded string in file content.
+
+        Args:
+            data (bytes): Raw content of the file.
+            needle (bytes): The exact string to search for, UTF-8 encoded.
+
+        Returns:
+            str: "STRING EXISTS" if found, "STRING NOT FOUND" otherwise.
+        """
+        found = contains_line(data, needle)
+        return "STRING EXISTS" if found else "STRING NOT FOUND"
+
+    @staticmethod
+    def _scan_stream(file: BinaryIO, needle: bytes) -> bool:
+        """
+        Scan a file by reading it into one reusable buffer.
+
+        Each read fills the buffer after the partial line carried over
+        from the previous read, so no per-read or per-line objects are
+        allocated.
+
+        Args:
+            file (BinaryIO): File opened in binary mode.
+            needle (bytes): Encoded search string.
+
+        Returns:
+            bool: True if a matching line is found, False otherwise.
+        """
+        buffer = bytearray(_BUFFER_SIZE)
+        carried = 0
+        while True:
+            if carried == len(buffer):
+                # A single line fills the buffer, so make room for more
+                buffer.extend(bytes(len(buffer)))
+            with memoryview(buffer) as view:
+                count = file.readinto(view[carried:])
+            if not count:
+                break
+
+            end = carried + count
+            # A final "\r" waits for the next read, which may pair it
+            # with a "\n"
+            complete = (
+                max(
+                    buffer.rfind(b"\n", 0, end),
+                    buffer.rfind(b"\r", 0, end - 1),
+                )
+                + 1
+            )
+            if contains_line(buffer, needle, complete):
+                return True
+            # Move the partial last line to the front of the buffer
+            carried = end - complete
+            buffer[:carried] = buffer[complete:end]
+
+        return bool(carried) and contains_line(buffer, needle, carried)
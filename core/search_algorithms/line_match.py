@@ -0,0 +1,101 @@
+"""
+Exact line matching over raw file bytes.
+
+Shared by the searchers that scan undecoded buffers: occurrences of the
+search string are located with `find`, which runs in C, and only the
+line enclosing each occurrence is compared. Lines end where
+`bytes.splitlines` ends them: at "\n", "\r" or "\r\n".
+"""
+
+import mmap
+from functools import partial
+from typing import Callable, Optional, Union
+
+# Any buffer supporting `find`, `rfind` and slicing
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+# Offset of the needle in buffer[start:end], or -1, given (start, end)
+Finder = Callable[[int, int], int]
+
+# Byte values removed by `bytes.strip`
+_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+
+def contains_line(
+    buffer: Buffer,
+    needle: bytes,
+    end: Optional[int] = None,
+    find: Optional[Finder] = None,
+) -> bool:
+    """
+    Check whether a line of the buffer equals the needle once stripped.
+
+    Args:
+        buffer (Buffer): Raw file bytes.
+        needle (bytes): Encoded search string.
+        end (Optional[int]): Offset just past the last line to scan.
+            Defaults to the end of the buffer.
+        find (Optional[Finder]): Locates the needle within a range of
+            the buffer. Defaults to the buffer's own `find`.
+
+    Returns:
+        bool: True if a matching line is found, False otherwise.
+    """
+    if end is None:
+        end = len(buffer)
+    if not needle:
+        # An empty string occurs everywhere, even between "\r" and "\n"
+        return b"" in map(bytes.strip, bytes(buffer[:end]).splitlines())
+    if needle != needle.strip() or b"\n" in needle or b"\r" in needle:
+        # A stripped line has no outer whitespace and no line breaks
+        return False
+    if find is None:
+        find = partial(buffer.find, needle)
+    pos = find(0, end)
+    while pos != -1 and pos < end:
+        after = pos + len(needle)
+        # A lone "\r" is looked for only within the "\n"-delimited line,
+        # so files without one are not rescanned for every match
+        line_start = buffer.rfind(b"\n", 0, pos) + 1
+        line_start = max(line_start, buffer.rfind(b"\r", line_start, pos) + 1)
+        line_end = buffer.find(b"\n", after, end)
+        if line_end == -1:
+            line_end = end
+        carriage = buffer.find(b"\r", after, line_end)
+        if carriage != -1:
+            line_end = carriage
+        if _line_equals(buffer, needle, pos, line_start, line_end):
+            return True
+        pos = find(line_end + 1, end)
+    return False
+
+
+def _line_equals(
+    buffer: Buffer, needle: bytes, pos: int, line_start: int, line_end: int
+) -> bool:
+    """
+    Check whether the line enclosing a match equals the needle stripped.
+
+    Unpadded lines are decided from the offsets, and matches inside
+    longer words from the neighbouring bytes, so only lines padded with
+    whitespace are copied and stripped.
+
+    Args:
+        buffer (Buffer): Raw file bytes.
+        needle (bytes): Encoded search string.
+        pos (int): Offset of the match.
+        line_start (int): Offset of the first byte of the line.
+        line_end (int): Offset of the line's break, or of its end.
+
+    Returns:
+        bool: True if the stripped line equals the needle.
+    """
+    after = pos + len(needle)
+    tail = line_end - after
+    if pos == line_start and tail == 0:
+        return True
+    if tail and buffer[after] not in _WHITESPACE:
+        return False
+    if pos > line_start and buffer[pos - 1] not in _WHITESPACE:
+        return False
+    return buffer[line_start:line_end].strip() == needle
@@ -0,0 +1,82 @@
+"""
+Process-wide cache of stripped line sets.
+
+Every searcher that answers queries from a set of a file's stripped lines
+gets it here, so each version of a file is split and indexed once per
+process however many searcher instances, or searcher classes, query it.
+"""
+
+import os
+import threading
+from typing import Optional, Tuple
+
+from .sequential_io import open_sequential
+
+# Files whose line sets are kept; the oldest is dropped beyond this
+_MAX_FILES = 16
+
+# Modification time and size of the file a line set was built from
+_Version = Tuple[int, int]
+
+# (st_dev, st_ino) -> (version, lines), keyed by the file itself so every
+# path leading to it shares one entry
+_LINE_SETS: dict[tuple[int, int], tuple[_Version, frozenset[bytes]]] = {}
+_BUILD_LOCK = threading.Lock()
+
+
+def peek_line_set(info: os.stat_result) -> Optional[frozenset[bytes]]:
+    """
+    Return the cached stripped lines of a file without building them.
+
+    Args:
+        info (os.stat_result): Metadata of the file.
+
+    Returns:
+        Optional[frozenset[bytes]]: The line set of this version of the
+        file, or None when it has not been built.
+    """
+    entry = _LINE_SETS.get((info.st_dev, info.st_ino))
+    if entry is not None and entry[0] == (info.st_mtime_ns, info.st_size):
+        return entry[1]
+    return None
+
+
+def get_line_set(filepath: str, info: os.stat_result) -> frozenset[bytes]:
+    """
+    Return the stripped lines of a file, building them only when needed.
+
+    Args:
+        filepath (str): Path to the file to index.
+        info (os.stat_result): Metadata of the file, used to tell whether
+            the cached set is still current.
+
+    Returns:
+        frozenset[bytes]: Stripped lines of the file.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    identity = (info.st_dev, info.st_ino)
+    # The size also catches rewrites within the mtime granularity
+    version = (info.st_mtime_ns, info.st_size)
+    entry = _LINE_SETS.get(identity)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    with _BUILD_LOCK:
+        # Another thread may have built it while this one waited
+        entry = _LINE_SETS.get(identity)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        with open_sequential(filepath) as file:
+            data = file.read()
+        # Splitting and stripping through `map` stays in C, with no
+        # generator frame resumed per line
+        lines = frozenset(map(bytes.strip, data.splitlines()))
+
+        _LINE_SETS.pop(identity, None)
+        if len(_LINE_SETS) >= _MAX_FILES:
+            del _LINE_SETS[next(iter(_LINE_SETS))]
+        _LINE_SETS[identity] = (version, lines)
+    return lines
@@ -9,12 +9,17 @@ import mmap
 import os
 from typing import Optional
 
-from .protocols import SearchProtocol
+from .base import BaseSearcher
+from .line_match import contains_line
+from .line_sets import get_line_set, peek_line_set
 
 from ..logger import logger
 
+# Files smaller than this are prefetched in full before being scanned
+_WILLNEED_LIMIT = 64 << 20
 
-class MmapSearcher(SearchProtocol):
+
+class MmapSearcher(BaseSearcher):
     """
     Perform a hybrid file search using memory-mapped access.
 
@@ -25,9 +30,10 @@ class MmapSearcher(SearchProtocol):
 
     def __init__(self) -> None:
         """Initialize MmapSearcher with optional cached data."""
+        super().__init__()
         self.last_filepath: Optional[str] = None
         self.cached_content: Optional[mmap.mmap] = None
-        self.line_cache: Optional[set[str]] = None
+        self.line_cache: Optional[frozenset[bytes]] = None
 
     def __repr__(self) -> str:
         """
@@ -41,31 +47,29 @@ class MmapSearcher(SearchProtocol):
             f"cached_content={'Set' if self.line_cache else 'None'})"
         )
 
-    def supports_caching(self) -> bool:
-        """
-        Indicate whether the search algorithm supports caching.
-
-        Returns:
-            bool: True if caching is supported, False otherwise.
-        """
-        return True
-
-    def _get_mmap(self, filepath: str) -> Optional[mmap.mmap]:
+    def _get_mmap(self, filepath: str, size: int) -> Optional[mmap.mmap]:
         """
         Create a memory-mapped object for file search.
 
         Args:
             filepath (str): Path to the target file.
+            size (int): Size of the file when it was stat'ed.
 
         Returns:
             Optional[mmap.mmap]: Memory-mapped file object if successful,
             otherwise None.
         """
+        if size == 0:
+            return None
         try:
             with open(filepath, "rb") as f:
-                if os.fstat(f.fileno()).st_size == 0:
-                    return None
-                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mapped, "madvise"):
+                # Skip the readahead ramp-up for the single linear scan
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+                if size < _WILLNEED_LIMIT:
+                    mapped.madvise(mmap.MADV_WILLNEED)
+            return mapped
 
         except FileNotFoundError:
             return None
@@ -73,75 +77,39 @@ class MmapSearcher(SearchProtocol):
             logger.error("Failed to mmap file: %s", e)
             return None
 
-    def _cache_lines(self, filepath: str) -> Optional[set[str]]:
+    def _do_search(
+        self,
+        filepath: str,
+        info: os.stat_result,
+        needle: bytes,
+        reread_on_query: bool,
+    ) -> bool:
         """
-        Cache file content into a set for fast lookups.
-
-        Args:
-            filepath (str): Path to the file to cache.
-
-        Returns:
-            Optional[set[str]]: A set containing unique lines from the file.
-        """
-        try:
-            with open(filepath, "r", encoding="utf-8") as file:
-                return {line.strip() for line in file}
-
-        except (OSError, ValueError) as e:
-            logger.error("Failed to cache lines: %s", e)
-            return None
-
-    def search(
-        self, filepath: str, search_string: str, reread_on_query: bool = False
-    ) -> str:
-        """
-        Search for a search_string in the specified file.
+        Search for a needle in the specified file.
 
         Uses memory mapping (`mmap`) for `reread=True`, and caches lines
         as a set for fast lookup when `reread=False`.
 
         Args:
             filepath (str): Path to the file to search.
-            search_string (str): Target string to look for.
+            info (os.stat_result): Metadata of the file.
+            needle (bytes): Encoded line to look for.
             reread_on_query (bool): Whether to reload the file on every query.
 
         Returns:
-            str: Search result:
-                - "STRING EXISTS" if the search_string is found.
-                - "STRING NOT FOUND" if the search_string is absent.
-                - "FILE NOT FOUND" if the file does not exist.
-                - "ERROR: <message>" if an exception occurs.
+            bool: True if a stripped line equals the needle.
         """
-        try:
-            if not os.path.exists(filepath):
-                return "FILE NOT FOUND"
-
-            if reread_on_query:
-                mm = self._get_mmap(filepath)
-                if mm is None:
-                    return "STRING NOT FOUND"
-
-                search_string_bytes = (search_string + os.linesep).encode(
-                    "utf-8"
-                )
-                found = mm.find(search_string_bytes) != -1
-                mm.close()
-
-                return "STRING EXISTS" if found else "STRING NOT FOUND"
-
-            if filepath != self.last_filepath or self.line_cache is None:
-                self.line_cache = self._cache_lines(filepath)
-                self.last_filepath = filepath
-
-            if self.line_cache is None:
-                return "STRING NOT FOUND"
-
-            return (
-                "STRING EXISTS"
-                if search_string in self.line_cache
-                else "STRING NOT FOUND"
-            )
-
-        except (OSError, ValueError) as e:
-            logger.error("MmapSearcher error: %s", e)
-            return f"ERROR: {e}"
+        # Lines already cached for this version of the file answer a
+        # reread as well as a fresh scan would
+        if reread_on_query and peek_line_set(info) is None:
+            mm = self._get_mmap(filepath, info.st_size)
+            if mm is None:
+                return False
+            # Whole lines are matched around each `find` hit, so the
+            # result does not depend on the platform's line ending
+            with mm:
+                return contains_line(mm, needle)
+
+        self.line_cache = get_line_set(filepath, info)
+        self.last_filepath = filepath
+        return needle in self.line_cache
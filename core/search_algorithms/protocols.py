@@ -1,10 +1,11 @@
 """
 Search protocol interface.
 
-Defines a standardized method signature for search algorithms.
+Defines a standardized method signature for search algorithms, and an
+optional one for algorithms that can search content already in memory.
 """
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 
 class SearchProtocol(Protocol):
@@ -22,3 +23,16 @@ class SearchProtocol(Protocol):
         Returns:
             bool: True if caching is supported, False otherwise.
         """
+
+
+@runtime_checkable
+class BytesSearchProtocol(Protocol):
+    """
+    Define the optional protocol for searching in-memory file content.
+
+    Implemented by algorithms that scan a buffer, so a caller already
+    holding the file's bytes can skip opening and reading the file.
+    """
+
+    def search_bytes(self, data: bytes, needle: bytes) -> str:
+        """Search for an encoded query in the given file content."""
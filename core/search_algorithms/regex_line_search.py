@@ -1,19 +1,75 @@
 """
 Regular expression-based search algorithm.
 
-Implements a search method that uses regex patterns to match lines
-in a file.
+Matches lines against the search string anchored at both ends. The
+string is always escaped, so the anchored pattern is a whole-line literal
+match; that is answered with one lookup in a set of the stripped lines
+instead of running the pattern over every line. On reread, one pattern
+is run over the whole file instead of splitting it into lines.
 """
 
+import os
 import re
+from functools import lru_cache
 from typing import Optional
 
-from .protocols import SearchProtocol
+from .base import BaseSearcher
+from .line_sets import get_line_set, peek_line_set
+from .sequential_io import open_sequential
 
-from ..logger import logger
+# Whitespace `bytes.strip` removes, other than the line breaks
+_PADDING = b" \t\x0b\x0c"
 
+# Line breaks recognized by `bytes.splitlines`
+_BREAKS = b"\r\n"
 
-class RegexLineSearcher(SearchProtocol):
+
+@lru_cache(maxsize=1024)
+def _line_end_pattern(needle: bytes) -> re.Pattern[bytes]:
+    """
+    Compile a pattern matching the needle at the end of a line.
+
+    The pattern starts with the needle itself, so `re` can skip ahead to
+    each occurrence in C; a leading `^` would make it try every line.
+
+    Args:
+        needle (bytes): Encoded, non-empty search string.
+
+    Returns:
+        re.Pattern[bytes]: The compiled pattern.
+    """
+    return re.compile(re.escape(needle) + rb"[ \t\x0b\x0c]*(?:[\r\n]|\Z)")
+
+
+def _contains_line(data: bytes, needle: bytes) -> bool:
+    """
+    Check whether a line of the data equals the needle once stripped.
+
+    Args:
+        data (bytes): Raw file content.
+        needle (bytes): Encoded search string.
+
+    Returns:
+        bool: True if a matching line is found, False otherwise.
+    """
+    if not needle:
+        return b"" in map(bytes.strip, data.splitlines())
+    if needle != needle.strip() or b"\n" in needle or b"\r" in needle:
+        # A stripped line has no outer whitespace and no line breaks
+        return False
+
+    for match in _line_end_pattern(needle).finditer(data):
+        # The line ends after the needle; it matches if only padding
+        # comes between the previous line break and the needle
+        start = match.start()
+        while start and data[start - 1] in _PADDING:
+            start -= 1
+        if not start or data[start - 1] in _BREAKS:
+            return True
+    return False
+
+
+class RegexLineSearcher(BaseSearcher):
     """
     Perform a search using regular expressions.
 
@@ -21,12 +77,14 @@ class RegexLineSearcher(SearchProtocol):
     searching.
 
     Attributes:
-        file_content (Optional[list[str]]): Cached content of the file.
+        line_set (Optional[frozenset[bytes]]): Stripped lines of the file
+        last searched from the cache.
     """
 
     def __init__(self) -> None:
         """Initialize RegexLineSearcher with an empty file content cache."""
-        self.file_content: Optional[list[str]] = None
+        super().__init__()
+        self.line_set: Optional[frozenset[bytes]] = None
 
     def __repr__(self) -> str:
         """
@@ -37,51 +95,36 @@ class RegexLineSearcher(SearchProtocol):
         """
         return (
             f"RegexLineSearcher(\n"
-            f"    file_content_size="
-            f"{len(self.file_content) if self.file_content else 0})"
+            f"    line_set_size="
+            f"{len(self.line_set) if self.line_set else 0})"
         )
 
-    def supports_caching(self) -> bool:
-        """
-        Indicate whether the search algorithm supports caching.
-
-        Returns:
-            bool: True if caching is supported, False otherwise.
-        """
-        return True
-
-    def search(
-        self, filepath: str, search_string: str, reread_on_query: bool = False
-    ) -> str:
+    def _do_search(
+        self,
+        filepath: str,
+        info: os.stat_result,
+        needle: bytes,
+        reread_on_query: bool,
+    ) -> bool:
         """
-        Search for lines matching a regex pattern.
+        Search for a line matching the escaped, anchored search string.
 
         Args:
             filepath (str): Path to the file to search.
-            search_string (str): Regex pattern to search for.
+            info (os.stat_result): Metadata of the file.
+            needle (bytes): Encoded line to look for.
             reread_on_query (bool): If True, rereads the file on every call.
 
         Returns:
-            str: One of the following results:
-                - "STRING EXISTS" if a match is found.
-                - "STRING NOT FOUND" if not.
-                - "FILE NOT FOUND" if the file does not exist.
-                - "ERROR: <message>" if an exception occurs.
+            bool: True if a stripped line equals the needle.
         """
-        try:
-            if reread_on_query or self.file_content is None:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    self.file_content = f.readlines()
-
-            pattern = re.compile(f"^{re.escape(search_string)}$")
-            for line in self.file_content:
-                if pattern.match(line.strip()):
-                    return "STRING EXISTS"
-
-            return "STRING NOT FOUND"
-
-        except FileNotFoundError:
-            return "FILE NOT FOUND"
-        except (OSError, ValueError) as e:
-            logger.error("RegexLineSearcher failed: %s", e)
-            return f"ERROR: {e}"
+        # `^re.escape(s)$` matches a stripped line exactly when the
+        # line equals `s`. Lines already cached for this version
+        # of the file answer a reread as well as a fresh scan would
+        if reread_on_query and peek_line_set(info) is None:
+            # A one-off scan stops at the first match, which is
+            # cheaper than building a set used once
+            with open_sequential(filepath) as f:
+                return _contains_line(f.read(), needle)
+        self.line_set = get_line_set(filepath, info)
+        return needle in self.line_set
@@ -5,26 +5,30 @@ Implements a search method that caches file contents in a set
 for fast lookups, avoiding repeated reads.
 """
 
+import os
 from typing import Optional
 
-from .protocols import SearchProtocol
+from .base import BaseSearcher
+from .line_sets import get_line_set
 
 
-class SetBasedSearcher(SearchProtocol):
+class SetBasedSearcher(BaseSearcher):
     """
     Cache lines from a file for efficient searches.
 
-    Uses a set to store file content and refreshes the cache only when
-    necessary.
+    Uses a frozen set of raw line bytes and refreshes the cache only when
+    necessary. Sets are shared by every instance, so each file is indexed
+    once per process until it changes on disk.
 
     Attributes:
-        cached_set (Optional[set[str]]): Cached set of lines
+        cached_set (Optional[frozenset[bytes]]): Cached set of lines
         (stripped of whitespace).
     """
 
     def __init__(self) -> None:
         """Initialize SetBasedSearcher with an empty cached set."""
-        self.cached_set: Optional[set[str]] = None
+        super().__init__()
+        self.cached_set: Optional[frozenset[bytes]] = None
 
     def __repr__(self) -> str:
         """
@@ -38,48 +42,26 @@ class SetBasedSearcher(SearchProtocol):
             f"cached_size={len(self.cached_set) if self.cached_set else 0})"
         )
 
-    def supports_caching(self) -> bool:
-        """
-        Indicate whether the search algorithm supports caching.
-
-        Returns:
-            bool: True if caching is supported, False otherwise.
-        """
-        return True
-
-    def search(
-        self, filepath: str, search_string: str, reread_on_query: bool = False
-    ) -> str:
+    def _do_search(
+        self,
+        filepath: str,
+        info: os.stat_result,
+        needle: bytes,
+        _reread_on_query: bool,
+    ) -> bool:
         """
         Search for a string using a cached set.
 
         Args:
             filepath (str): Path to the file to be searched.
-            search_string (str): The string to search for in the file.
-            reread_on_query (bool): Whether to refresh the cached set
-            before searching.
+            info (os.stat_result): Metadata of the file.
+            needle (bytes): Encoded line to look for.
+            _reread_on_query (bool): Unused, the set is rebuilt whenever
+                the file changes.
 
         Returns:
-            str: One of the following results:
-                - "STRING EXISTS" if the string is found.
-                - "STRING NOT FOUND" if not.
-                - "FILE NOT FOUND" if the file does not exist.
-                - An error message if an exception occurs.
+            bool: True if the string is a stripped line of the file.
         """
-        try:
-            # Refresh the cached set if required
-            if reread_on_query or self.cached_set is None:
-                with open(filepath, "r", encoding="utf-8") as file:
-                    self.cached_set = {line.strip() for line in file}
-
-            # Search for the string in the cached set
-            return (
-                "STRING EXISTS"
-                if search_string in self.cached_set
-                else "STRING NOT FOUND"
-            )
-
-        except FileNotFoundError:
-            return "FILE NOT FOUND"
-        except (OSError, ValueError) as e:
-            return f"ERROR: {str(e)}"
+        # Refresh the cached set if the file changed
+        self.cached_set = get_line_set(filepath, info)
+        return needle in self.cached_set
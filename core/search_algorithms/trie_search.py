@@ -1,102 +1,31 @@
 """
 Trie-based search algorithm.
 
-Implements a search method that builds a Trie from file contents and
-performs full-line search_string matches efficiently.
+Answers exact full-line queries, which a hashed set serves with a single
+probe instead of a walk of one node per byte, so the file lines are
+indexed in a frozenset.
 """
 
-from typing import Dict, Optional
+from typing import Optional
 
 from .protocols import SearchProtocol
+from .sequential_io import open_sequential
 
 from ..logger import logger
 
 
-class TrieNode:
-    """
-    Represent a node in the Trie structure.
-
-    Stores child nodes, matching lines, and marks the end of a stored string.
-    """
-
-    def __init__(self) -> None:
-        """Initialize TrieNode with empty children and line storage."""
-        self.children: Dict[str, "TrieNode"] = {}
-        self.lines: list[str] = []
-        self.is_end: bool = False
-
-    def has_children(self) -> bool:
-        """
-        Check if the TrieNode has any child nodes.
-
-        Returns:
-            bool: True if it has children, False otherwise.
-        """
-        return bool(self.children)
-
-    def __repr__(self) -> str:
-        """
-        Return a string representation of the TrieNode.
-
-        Returns:
-            str: Summary of stored lines and children count.
-        """
-        return (
-            f"TrieNode(children={len(self.children)}, "
-            f"lines={len(self.lines)})"
-        )
-
-
-class Trie:
-    """Implement a Trie (prefix tree) for full-line string matches."""
-
-    def __init__(self) -> None:
-        """Initialize an empty Trie with a root node."""
-        self.root = TrieNode()
-
-    def insert(self, line: str) -> None:
-        """
-        Insert a line into the Trie character by character.
-
-        Args:
-            line (str): A line from the file to insert into the Trie.
-        """
-        node = self.root
-        for char in line:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-        node.is_end = True
-        node.lines.append(line)
-
-    def search_exact(self, line: str) -> bool:
-        """
-        Check if an exact full-line match exists in the Trie.
-
-        Args:
-            line (str): The exact line to match.
-
-        Returns:
-            bool: True if the line exists, else False.
-        """
-        node = self.root
-        for char in line:
-            if char not in node.children:
-                return False
-            node = node.children[char]
-        return node.is_end and line in node.lines
-
-
 class TrieBasedSearcher(SearchProtocol):
     """
-    Perform full-line search_string searches using a Trie-based approach.
+    Perform full-line search_string searches over an indexed file.
 
-    The Trie is constructed from file contents and provides efficient lookups.
+    Only exact full-line matches are ever queried, so the lines are held
+    in a frozenset: a lookup hashes the query once instead of walking
+    one node per character.
     """
 
     def __init__(self) -> None:
-        """Initialize TrieBasedSearcher with an empty Trie."""
-        self.trie = Trie()
+        """Initialize TrieBasedSearcher with an empty line index."""
+        self.lines: frozenset[bytes] = frozenset()
         self.loaded_file: Optional[str] = None
 
     def __repr__(self) -> str:
@@ -104,9 +33,12 @@ class TrieBasedSearcher(SearchProtocol):
         Return a string representation of the TrieBasedSearcher instance.
 
         Returns:
-            str: Summary of Trie state and loaded file.
+            str: Summary of the index size and loaded file.
         """
-        return f"TrieBasedSearcher(loaded_file={self.loaded_file})"
+        return (
+            f"TrieBasedSearcher(loaded_file={self.loaded_file}, "
+            f"lines={len(self.lines)})"
+        )
 
     def supports_caching(self) -> bool:
         """
@@ -121,10 +53,10 @@ class TrieBasedSearcher(SearchProtocol):
         self, filepath: str, reread_on_query: bool = False
     ) -> None:
         """
-        Load the file into the Trie.
+        Load the stripped file lines into the index.
 
         If not already loaded or if `reread_on_query` is True,
-        rebuild the Trie with new data.
+        rebuild the index with new data.
 
         Args:
             filepath (str): Path to the file to index.
@@ -133,17 +65,16 @@ class TrieBasedSearcher(SearchProtocol):
         if not reread_on_query and self.loaded_file == filepath:
             return
 
-        self.trie = Trie()
-        with open(filepath, "r", encoding="utf-8") as file:
-            for line in file:
-                self.trie.insert(line.strip())
+        with open_sequential(filepath) as file:
+            data = file.read()
+        self.lines = frozenset(line.strip() for line in data.splitlines())
         self.loaded_file = filepath
 
     def search(
         self, filepath: str, search_string: str, reread_on_query: bool = False
     ) -> str:
         """
-        Search for an exact search_string match using a Trie.
+        Search for an exact search_string match in the line index.
 
         Args:
             filepath (str): Path to the file to search.
@@ -162,7 +93,7 @@ class TrieBasedSearcher(SearchProtocol):
             self._preload_file(filepath, reread_on_query)
             return (
                 "STRING EXISTS"
-                if self.trie.search_exact(search_string)
+                if search_string.encode("utf-8") in self.lines
                 else "STRING NOT FOUND"
             )
         except FileNotFoundError:
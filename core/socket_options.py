@@ -0,0 +1,79 @@
+"""
+Socket options.
+
+Small queries and replies are latency bound, so every TCP socket disables
+Nagle's algorithm; otherwise a reply can wait for a delayed ACK.
+"""
+
+import socket
+
+# Pending TCP Fast Open requests the listener queues
+_FASTOPEN_QUEUE = 128
+
+
+def create_client_socket() -> socket.socket:
+    """
+    Create a TCP socket tuned for small request/response messages.
+
+    Returns:
+        socket.socket: An unconnected IPv4 stream socket with TCP_NODELAY.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def create_listener_socket() -> socket.socket:
+    """
+    Create a TCP socket to listen on for clients of either IP version.
+
+    Where the host supports it, one IPv6 socket with IPV6_V6ONLY cleared
+    accepts IPv4 clients too, as IPv4-mapped addresses.
+
+    Returns:
+        socket.socket: An unbound dual-stack IPv6 socket, or an IPv4 one
+        when dual-stack sockets are unavailable.
+    """
+    if not socket.has_dualstack_ipv6():
+        return socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+    return sock
+
+
+def wildcard_address(sock: socket.socket) -> str:
+    """
+    Return the address binding a socket to every local interface.
+
+    Args:
+        sock (socket.socket): Socket to be bound.
+
+    Returns:
+        str: "::" for IPv6 sockets, "0.0.0.0" otherwise.
+    """
+    return "::" if sock.family == socket.AF_INET6 else "0.0.0.0"
+
+
+def configure_listener(sock: socket.socket) -> None:
+    """
+    Prepare a listening socket before it is bound.
+
+    SO_REUSEADDR lets the server rebind while old connections sit in
+    TIME_WAIT. TCP_NODELAY is inherited by accepted sockets on Linux and
+    the BSDs, so replies to clients are not held back either. Where the
+    platform supports TCP Fast Open, returning clients may send their
+    first bytes with the SYN, saving a round trip on reconnects.
+
+    Args:
+        sock (socket.socket): Unbound TCP socket.
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if hasattr(socket, "TCP_FASTOPEN"):
+        try:
+            sock.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_FASTOPEN, _FASTOPEN_QUEUE
+            )
+        except OSError:
+            # Disabled by the kernel; connections use the normal handshake
+            pass
@@ -0,0 +1,46 @@
+"""
+SSL context cache.
+
+Builds client-side mutual TLS contexts once per certificate set so that
+PEM files are not read and parsed again for every connection.
+"""
+
+import ssl
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4)
+def client_ssl_context(
+    certfile: str, keyfile: str, ca_bundle: str
+) -> ssl.SSLContext:
+    """
+    Return a shared client context for mutual TLS (mTLS) authentication.
+
+    The context is created on first use and reused by every connection
+    and thread presenting the same certificates. Failures are not cached.
+
+    Args:
+        certfile (str): Path to the client certificate.
+        keyfile (str): Path to the client private key.
+        ca_bundle (str): Path to the CA bundle used to verify the server.
+
+    Returns:
+        ssl.SSLContext: Configured client context.
+
+    Raises:
+        ssl.SSLError: If the certificates cannot be loaded.
+        OSError: If a certificate file cannot be read.
+    """
+    context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+
+    # Load client-side certificate and private key
+    context.load_cert_chain(certfile=certfile, keyfile=keyfile)
+
+    # Enforce mutual TLS authentication
+    context.verify_mode = ssl.CERT_REQUIRED
+    context.load_verify_locations(ca_bundle)
+
+    # Restrict TLS 1.2 to forward-secret AES-GCM suites
+    context.set_ciphers("ECDHE+AESGCM")
+    context.options |= ssl.OP_NO_COMPRESSION
+    return context
@@ -2,13 +2,126 @@
 SSL socket wrapper.
 
 Encapsulates the setup of an SSL context and the wrapping of socket
-objects using the provided certificate and private key.
+objects using the provided certificate and private key. Contexts are
+shared between wrappers presenting the same certificate files, so PEM
+files are parsed again only when one of them changes on disk.
 """
 
+import os
 import ssl
+import threading
 from socket import socket
+from typing import Tuple
 from core.logger import logger
 
+# Paths and modification times of the certificate, key and CA bundle
+_ContextKey = Tuple[str, str, str, int, int, int]
+
+_CTX_CACHE: dict[_ContextKey, ssl.SSLContext] = {}
+_CTX_LOCK = threading.Lock()
+
+
+def _context_key(certfile: str, keyfile: str, ca_bundle: str) -> _ContextKey:
+    """
+    Build the cache key identifying a certificate set and its version.
+
+    Args:
+        certfile (str): Path to the server certificate.
+        keyfile (str): Path to the server private key.
+        ca_bundle (str): Path to the CA bundle used to verify clients.
+
+    Returns:
+        _ContextKey: The paths followed by their modification times.
+
+    Raises:
+        OSError: If one of the files cannot be accessed.
+    """
+    return (
+        certfile,
+        keyfile,
+        ca_bundle,
+        os.stat(certfile).st_mtime_ns,
+        os.stat(keyfile).st_mtime_ns,
+        os.stat(ca_bundle).st_mtime_ns,
+    )
+
+
+def _build_context(
+    certfile: str, keyfile: str, ca_bundle: str
+) -> ssl.SSLContext:
+    """
+    Create a server context requiring client certificates.
+
+    Args:
+        certfile (str): Path to the server certificate.
+        keyfile (str): Path to the server private key.
+        ca_bundle (str): Path to the CA bundle used to verify clients.
+
+    Returns:
+        ssl.SSLContext: Configured server context.
+
+    Raises:
+        ssl.SSLError: If the certificates cannot be loaded.
+    """
+    try:
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+
+        # Load server's certificate and private key
+        context.load_cert_chain(certfile=certfile, keyfile=keyfile)
+
+        # Require client authentication (mTLS enabled)
+        context.verify_mode = ssl.CERT_REQUIRED
+
+        # Load trusted CA bundle to validate clients
+        context.load_verify_locations(ca_bundle)
+
+        # TLS 1.3 only: a one round trip handshake, and resumption
+        # through the session tickets OpenSSL issues by default.
+        # Its AES-GCM suites run on AES-NI where the CPU has it; the
+        # cipher string below also limits any TLS 1.2 fallback
+        # configured later to forward-secret AES-GCM
+        context.minimum_version = ssl.TLSVersion.TLSv1_3
+        context.set_ciphers("ECDHE+AESGCM:!aNULL")
+
+    except ssl.SSLError as e:
+        logger.error("Failed to initialize SSL context: %s", e)
+        raise
+    return context
+
+
+def get_or_build_context(
+    certfile: str, keyfile: str, ca_bundle: str
+) -> ssl.SSLContext:
+    """
+    Return the shared server context for a certificate set.
+
+    The context is built, and the PEM files parsed, only on first use or
+    after one of the files changes on disk; every other call costs three
+    `stat` calls and a dictionary lookup.
+
+    Args:
+        certfile (str): Path to the server certificate.
+        keyfile (str): Path to the server private key.
+        ca_bundle (str): Path to the CA bundle used to verify clients.
+
+    Returns:
+        ssl.SSLContext: Configured server context.
+
+    Raises:
+        ssl.SSLError: If the certificates cannot be loaded.
+        OSError: If one of the files cannot be accessed.
+    """
+    key = _context_key(certfile, keyfile, ca_bundle)
+    with _CTX_LOCK:
+        context = _CTX_CACHE.get(key)
+        if context is None:
+            context = _build_context(certfile, keyfile, ca_bundle)
+            # Drop contexts built from older versions of these files
+            for stale in [k for k in _CTX_CACHE if k[:3] == key[:3]]:
+                del _CTX_CACHE[stale]
+            _CTX_CACHE[key] = context
+    return context
+
 
 class SSLSocketWrapper:
     """
@@ -24,23 +137,7 @@ class SSLSocketWrapper:
         self.keyfile = keyfile
         self.ca_bundle = ca_bundle
 
-        try:
-            self.context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-
-            # Load server's certificate and private key
-            self.context.load_cert_chain(
-                certfile=self.certfile, keyfile=self.keyfile
-            )
-
-            # Require client authentication (mTLS enabled)
-            self.context.verify_mode = ssl.CERT_REQUIRED
-
-            # Load trusted CA bundle to validate clients
-            self.context.load_verify_locations(self.ca_bundle)
-
-        except ssl.SSLError as e:
-            logger.error("Failed to initialize SSL context: %s", e)
-            raise
+        self.context = get_or_build_context(certfile, keyfile, ca_bundle)
 
     def wrap(self, sock: socket) -> ssl.SSLSocket:
         """
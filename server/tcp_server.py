@@ -3,25 +3,68 @@ TCP/SSL search server.
 
 Implements a file search server that accepts incoming client connections,
 wraps them in secure channels if configured, and hands them off to
-ClientHandler sessions.
+ClientHandler sessions. All connections are multiplexed on one asyncio
+event loop instead of a thread each.
 """
 
+import asyncio
 import os
 import platform
 import sys
 import socket
-import threading
 import signal
-from typing import Tuple
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
 # First-party imports (your internal modules)
 from config.settings import CONFIG_FILE_PATH
 
 # Core module imports (grouped together)
-from core.ssl_wrapper import SSLSocketWrapper
+from core.ssl_wrapper import get_or_build_context
 from core.config_loader import get_config_value
-from core.logger import logger
-from core.connection_handler import ClientHandler
+from core.logger import log_to_file, logger
+from core.connection_handler import AsyncClientHandler
+from core.framing import frame
+from core.socket_options import (
+    configure_listener,
+    create_listener_socket,
+    wildcard_address,
+)
+
+# Signals that shut the server down cleanly
+_STOP_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+# Streams can be upgraded to TLS from Python 3.11; before that asyncio
+# completes the handshake before a client can be counted or refused
+_UPGRADE_STREAMS = hasattr(asyncio.StreamWriter, "start_tls")
+
+# Reply to clients refused because every slot is taken
+_BUSY_REPLY = frame(b"ERROR: server busy")
+
+
+def _redirect(path: str, *targets: int) -> None:
+    """
+    Point file descriptors at the end of a log file.
+
+    The file is opened as a raw descriptor; no Python file object is
+    needed just to duplicate it.
+
+    Args:
+        path (str): Log file, created if missing.
+        *targets (int): Descriptors to replace, such as stdout's.
+
+    Raises:
+        OSError: If the file cannot be opened.
+    """
+    fd = os.open(
+        path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644
+    )
+    try:
+        for target in targets:
+            os.dup2(fd, target)
+    finally:
+        os.close(fd)
 
 
 class SearchServer:
@@ -43,18 +86,45 @@ class SearchServer:
                 CONFIG_FILE_PATH, "ssl_enabled", default=False
             ),
             "file_path": get_config_value(CONFIG_FILE_PATH, "linuxpath"),
+            # Processes each accepting on their own socket; more than one
+            # is opt-in, as every process keeps its own caches
+            "workers": int(
+                get_config_value(
+                    CONFIG_FILE_PATH, "server_workers", default=1
+                )
+            ),
+            # Threads running searches for the clients of one worker
+            "search_threads": int(
+                get_config_value(
+                    CONFIG_FILE_PATH,
+                    "search_threads",
+                    default=min(32, (os.cpu_count() or 1) + 4),
+                )
+            ),
+            # Connections one worker serves at once; others are refused
+            "max_clients": int(
+                get_config_value(
+                    CONFIG_FILE_PATH, "max_clients", default=1024
+                )
+            ),
         }
 
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket = create_listener_socket()
         self.log_config = {
             "log_dir": get_config_value(
                 CONFIG_FILE_PATH, "log_dir", default="/var/log"
             ),
-            "clients": [],
+            # Writers of connected clients; removal must not scan
+            "clients": set(),
         }
+        # Joined once; the log directory does not change while running
+        self._log_paths = (
+            os.path.join(self.log_config["log_dir"], "tcpserver.log"),
+            os.path.join(self.log_config["log_dir"], "tcpserver_error.log"),
+        )
 
-        # Lock to prevent race conditions
-        self.clients_lock = threading.Lock()
+        # Set while serving; stops the event loop when set
+        self.stop_event: Optional[asyncio.Event] = None
 
         # SSL Certificates
         self.ssl_certificates = {
@@ -72,13 +142,19 @@ class SearchServer:
             ),
         }
 
+        # Built once, before any fork, so every worker inherits it and
+        # certificate errors surface when the server is created
+        self.ssl_context: Optional[ssl.SSLContext] = None
+        if self.server_config["ssl_enabled"]:
+            self.ssl_context = get_or_build_context(
+                self.ssl_certificates["server_certfile"],
+                self.ssl_certificates["server_keyfile"],
+                self.ssl_certificates["ca_bundle"],
+            )
+
     def _get_log_paths(self) -> Tuple[str, str]:
         """Return paths for stdout and stderr log files."""
-        stdout_path = os.path.join(self.log_config["log_dir"], "tcpserver.log")
-        stderr_path = os.path.join(
-            self.log_config["log_dir"], "tcpserver_error.log"
-        )
-        return stdout_path, stderr_path
+        return self._log_paths
 
     def daemonize(self) -> None:
         """Run the server as a background process."""
@@ -96,69 +172,123 @@ class SearchServer:
             sys.stdout.flush()
             sys.stderr.flush()
 
-            stdout_path, stderr_path = self._get_log_paths()
+            log_path, stderr_path = self._get_log_paths()
 
+            # Records go to the log file through the logger; stderr only
+            # catches what bypasses it, such as interpreter tracebacks
             try:
                 os.makedirs(self.log_config["log_dir"], exist_ok=True)
-                with open(stdout_path, "a", encoding="utf-8") as stdout, open(
-                    stderr_path, "a", encoding="utf-8"
-                ) as stderr:
-                    os.dup2(stdout.fileno(), sys.stdout.fileno())
-                    os.dup2(stderr.fileno(), sys.stderr.fileno())
+                _redirect(stderr_path, sys.stderr.fileno())
             except (PermissionError, OSError) as e:
                 logger.warning(
                     "Log path inaccessible (%s), falling back to home dir.",
                     e,
                 )
-                fallback_log = os.path.expanduser("~/tcpserver.log")
-                with open(fallback_log, "a", encoding="utf-8") as stdout:
-                    os.dup2(stdout.fileno(), sys.stdout.fileno())
-                    os.dup2(stdout.fileno(), sys.stderr.fileno())
+                log_path = os.path.expanduser("~/tcpserver.log")
+                _redirect(log_path, sys.stderr.fileno())
+            _redirect(os.devnull, sys.stdout.fileno())
+            log_to_file(log_path)
 
-            signal.signal(signal.SIGTERM, self.shutdown)
-
-    def shutdown(self, _signum: int, _frame: object) -> None:
+    def shutdown(self) -> None:
         """Shutdown the server and close client connections."""
         logger.info("Shutting down server.")
 
-        with self.clients_lock:
-            for client in self.log_config["clients"]:
-                try:
-                    client.close()
-                except (OSError, ValueError) as e:
-                    logger.warning("Error closing client: %s", e)
+        # Only the event loop thread touches the client list
+        for client in list(self.log_config["clients"]):
+            try:
+                client.close()
+            except (OSError, ValueError) as e:
+                logger.warning("Error closing client: %s", e)
 
-        self.server_socket.close()
-        sys.exit(0)
+        if self.stop_event is not None:
+            self.stop_event.set()
 
-    def _setup_socket(self) -> None:
-        """Bind server socket and begin listening."""
-        self.server_socket.bind(("0.0.0.0", self.server_config["port"]))
-        self.server_socket.listen(5)
-        logger.info("Server started on port %s", self.server_config["port"])
+    def _setup_socket(self, reuse_port: bool = False) -> None:
+        """
+        Bind server socket and begin listening.
 
-    def _handle_client(
-        self, client_socket: socket.socket, client_address: Tuple[str, int]
-    ) -> None:
-        """Handle client connection with mutual TLS authentication."""
-        if self.server_config["ssl_enabled"]:
-            ssl_wrapper = SSLSocketWrapper(
-                self.ssl_certificates["server_certfile"],
-                self.ssl_certificates["server_keyfile"],
-                self.ssl_certificates["ca_bundle"],
+        Args:
+            reuse_port (bool): Whether other worker processes may bind
+                the same port. Otherwise the bind is exclusive, so a
+                second server on the port fails instead of silently
+                taking a share of the connections.
+        """
+        configure_listener(self.server_socket)
+        if reuse_port:
+            # Each worker binds its own socket to the port, and the kernel
+            # spreads new connections across their accept queues
+            self.server_socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_REUSEPORT, 1
             )
-            client_socket = ssl_wrapper.wrap(client_socket)
-
-        with self.clients_lock:
-            self.log_config["clients"].append(client_socket)
+        self.server_socket.bind(
+            (
+                wildcard_address(self.server_socket),
+                self.server_config["port"],
+            )
+        )
+        # A short backlog drops connections during bursts of accepts
+        self.server_socket.listen(socket.SOMAXCONN)
+        logger.info("Server started on port %s", self.server_config["port"])
 
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Admit a client if a slot is free, then secure and serve it."""
+        peer = writer.get_extra_info("peername")
+        clients = self.log_config["clients"]
+        if len(clients) >= self.server_config["max_clients"]:
+            # Refused before the handshake, so excess clients cost no
+            # TLS work and no work is queued for them
+            logger.warning("Too many clients, refusing %s", peer)
+            writer.write(_BUSY_REPLY)
+            writer.close()
+            return
+        # The slot is taken before the handshake, so clients still
+        # handshaking count against the limit too
+        clients.add(writer)
         try:
-            session = ClientHandler(client_socket, client_address)
-            session.handle()
+            if self.ssl_context is not None and _UPGRADE_STREAMS:
+                try:
+                    await writer.start_tls(self.ssl_context)
+                except (OSError, asyncio.TimeoutError) as e:
+                    logger.warning("Handshake with %s failed: %s", peer, e)
+                    writer.close()
+                    return
+            logger.info("Accepted connection from %s", peer)
+            await AsyncClientHandler(reader, writer).handle_async()
         finally:
-            client_socket.close()
-            with self.clients_lock:
-                self.log_config["clients"].remove(client_socket)
+            clients.discard(writer)
+
+    async def _serve(self) -> None:
+        """Serve clients on the listening socket until shut down."""
+        self.stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        # A fixed pool runs the searches; asyncio.run shuts it down
+        loop.set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=self.server_config["search_threads"],
+                thread_name_prefix="search",
+            )
+        )
+        try:
+            # Ctrl-C in the foreground stops the server the same way
+            for signum in _STOP_SIGNALS:
+                loop.add_signal_handler(signum, self.shutdown)
+        except (NotImplementedError, RuntimeError):
+            # Windows event loops take no signal handlers, and only the
+            # main thread can install them
+            pass
+
+        # The backlog is also how many connections asyncio accepts per
+        # wake-up, draining bursts in one pass; it calls listen() again
+        server = await asyncio.start_server(
+            self._handle_client,
+            sock=self.server_socket,
+            ssl=None if _UPGRADE_STREAMS else self.ssl_context,
+            backlog=socket.SOMAXCONN,
+        )
+        async with server:
+            await self.stop_event.wait()
 
     def start(self) -> None:
         """Start the main server loop and listen for incoming connections."""
@@ -166,18 +296,81 @@ class SearchServer:
             "/run/systemd/system"
         ):
             self.daemonize()
-        self._setup_socket()
+        workers = self.server_config["workers"]
+        if workers > 1 and hasattr(socket, "SO_REUSEPORT"):
+            self._run_workers(workers)
+        else:
+            self._run_worker()
 
-        while True:
-            try:
-                client_socket, client_address = self.server_socket.accept()
-                logger.info("Accepted connection from %s", client_address)
+    def _run_worker(self, reuse_port: bool = False) -> None:
+        """
+        Listen on the port and serve clients in this process.
 
-                threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, client_address),
-                    daemon=True,
-                ).start()
+        Args:
+            reuse_port (bool): Whether the port is shared with the other
+                worker processes.
+        """
+        self._setup_socket(reuse_port)
+        asyncio.run(self._serve())
 
-            except (OSError, ValueError) as e:
-                logger.error("Server error: %s", e)
+    def _run_workers(self, count: int) -> None:
+        """
+        Fork worker processes and wait for them to exit.
+
+        Every worker binds its own SO_REUSEPORT socket, so accepts are not
+        funnelled through a single queue, and is pinned to one CPU where
+        the platform allows it. SIGTERM and SIGINT stop every worker.
+
+        Args:
+            count (int): Number of worker processes to start.
+        """
+        cpus = (
+            sorted(os.sched_getaffinity(0))
+            if hasattr(os, "sched_getaffinity")
+            else []
+        )
+        children = []
+        for index in range(count):
+            pid = os.fork()  # pylint: disable=no-member
+            if pid == 0:
+                cpu = cpus[index % len(cpus)] if cpus else None
+                self._run_forked_worker(cpu)
+            children.append(pid)
+        # The parent only supervises; its socket was never bound
+        self.server_socket.close()
+
+        def stop_workers(_signum: int, _frame: object) -> None:
+            for child in children:
+                try:
+                    os.kill(child, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+        for signum in _STOP_SIGNALS:
+            signal.signal(signum, stop_workers)
+        for child in children:
+            os.waitpid(child, 0)  # pylint: disable=no-member
+
+    def _run_forked_worker(self, cpu: Optional[int]) -> None:
+        """
+        Serve clients in a freshly forked worker, then end the process.
+
+        Args:
+            cpu (Optional[int]): CPU to pin the worker to, if any.
+        """
+        status = 1
+        try:
+            if cpu is not None:
+                os.sched_setaffinity(0, {cpu})
+            # The inherited socket object is shared with the other
+            # processes, so every worker binds a fresh one
+            self.server_socket.close()
+            self.server_socket = create_listener_socket()
+            self._run_worker(reuse_port=True)
+            status = 0
+        # pylint: disable-next=broad-exception-caught
+        except Exception as e:
+            # Must not unwind into the parent's fork loop
+            logger.error("Worker %s failed: %s", os.getpid(), e)
+        finally:
+            os._exit(status)  # pylint: disable=protected-access
@@ -8,10 +8,10 @@ on files of different sizes.
 import time
 import csv
 import os
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Callable
 
-import psutil
-
 # First-party imports (your internal modules)
 from config.settings import CONFIG_FILE_PATH
 from core.config_loader import get_config_value
@@ -25,7 +25,19 @@ from core.search_algorithms.regex_line_search import RegexLineSearcher
 from core.search_algorithms.trie_search import TrieBasedSearcher
 from core.search_algorithms.cached_line_search import CachedLineSearcher
 from core.search_algorithms.set_based_searcher import SetBasedSearcher
-from core.search_algorithms.protocols import SearchProtocol
+from core.search_algorithms.c_mmap_search import CMmapSearcher
+from core.search_algorithms.aho_corasick_search import AhoCorasickSearcher
+from core.search_algorithms.protocols import (
+    BytesSearchProtocol,
+    SearchProtocol,
+)
+
+# Minimum length of one timed run; fast searchers are repeated until a run
+# is long enough for timer resolution and noise to be negligible
+MIN_RUN_NS = 10_000_000
+
+# Number of test file lines joined into each write
+GENERATE_BLOCK_LINES = 100_000
 
 
 class SearchBenchmarkRunner:
@@ -34,6 +46,7 @@ class SearchBenchmarkRunner:
 
     Attributes:
         search_term (str): The term to be searched in files.
+        search_term_bytes (bytes): The search term, encoded once.
         sizes (List[int]): List of file sizes (number of lines).
         reread_on_query (bool): Whether to reread the file on each search.
         temp_dir (str): Directory to generate test files.
@@ -47,6 +60,7 @@ class SearchBenchmarkRunner:
             "search_term",
             default="Stephen is overly talented",
         )
+        self.search_term_bytes = self.search_term.encode("utf-8")
         self.sizes = [10_000, 100_000, 500_000, 1_000_000]
         self.reread_on_query = get_config_value(
             CONFIG_FILE_PATH, "reread", default=False
@@ -63,6 +77,8 @@ class SearchBenchmarkRunner:
             ("TrieSearcher", TrieBasedSearcher()),
             ("CachedLineSearcher", CachedLineSearcher()),
             ("SetBasedSearcher", SetBasedSearcher()),
+            ("CMmapSearcher", CMmapSearcher()),
+            ("AhoCorasickSearcher", AhoCorasickSearcher()),
         ]
 
     def generate_test_file(self, line_count: int, filename: str) -> str:
@@ -80,11 +96,47 @@ class SearchBenchmarkRunner:
         """
         filepath = os.path.join(self.temp_dir, filename)
         with open(filepath, "w", encoding="utf-8") as f:
-            for i in range(line_count):
-                f.write(f"This is line number {i}\n")
+            # Join lines in blocks, so large files take few write calls
+            # without building the whole file in memory
+            for block in range(0, line_count, GENERATE_BLOCK_LINES):
+                stop = min(block + GENERATE_BLOCK_LINES, line_count)
+                f.write(
+                    "".join(
+                        f"This is line number {i}\n"
+                        for i in range(block, stop)
+                    )
+                )
             f.write(self.search_term + "\n")
         return filepath
 
+    def search_func(
+        self, searcher: SearchProtocol, content: bytes
+    ) -> Callable[[str, str, bool], str]:
+        """
+        Choose how an algorithm is benchmarked against a test file.
+
+        Algorithms that can search in-memory content are given the file's
+        bytes, read once per file size, instead of reopening the file, and
+        the pre-encoded search term.
+
+        Args:
+            searcher (SearchProtocol): The search algorithm.
+            content (bytes): Raw content of the test file.
+
+        Returns:
+            Callable: A function accepting
+                (file_path, search_term, reread_on_query).
+        """
+        if not isinstance(searcher, BytesSearchProtocol):
+            return searcher.search
+
+        needle = self.search_term_bytes
+
+        def search_content(_path: str, _term: str, _reread: bool) -> str:
+            return searcher.search_bytes(content, needle)
+
+        return search_content
+
     def benchmark_algorithm(
         self,
         algorithm_func: Callable[[str, str, bool], str],
@@ -96,6 +148,8 @@ class SearchBenchmarkRunner:
 
         Runs the search function multiple times and computes the average
         execution time (in milliseconds) and memory usage (in megabytes).
+        Each run repeats the search until it lasts at least `MIN_RUN_NS`,
+        and the measured overhead of the timing loop is subtracted.
 
         Args:
             algorithm_func (Callable): The search function to benchmark.
@@ -106,27 +160,121 @@ class SearchBenchmarkRunner:
         Returns:
             Tuple[float, float]: A tuple containing:
                 - Average execution time in milliseconds.
-                - Average memory usage in megabytes (MB).
+                - Average peak memory allocated by one search in
+                  megabytes (MB).
         """
-        algorithm_func(file_path, self.search_term, self.reread_on_query)
+        inner = self._inner_repeats(algorithm_func, file_path)
+        overhead_ns = self._call_overhead_ns(file_path, inner)
 
-        process = psutil.Process(os.getpid())
-        total_time = 0.0
-        total_memory = 0.0
+        total_ns = 0
         for _ in range(num_runs):
-            start_time = time.time()
-            start_mem = process.memory_info().rss
+            start = time.perf_counter_ns()
+            for _ in range(inner):
+                algorithm_func(
+                    file_path, self.search_term, self.reread_on_query
+                )
+            end = time.perf_counter_ns()
+            total_ns += max(end - start - overhead_ns, 0)
 
-            algorithm_func(file_path, self.search_term, self.reread_on_query)
+        avg_time = total_ns / inner / num_runs / 1e6
+        avg_memory = self._peak_memory_mb(algorithm_func, file_path, num_runs)
+        return avg_time, avg_memory
 
-            end_mem = process.memory_info().rss
-            end_time = time.time()
-            total_time += end_time - start_time
-            total_memory += end_mem - start_mem
+    def _peak_memory_mb(
+        self,
+        algorithm_func: Callable[[str, str, bool], str],
+        file_path: str,
+        num_runs: int,
+    ) -> float:
+        """
+        Measure the memory a search allocates while it runs.
 
-        avg_time = (total_time / num_runs) * 1000
-        avg_memory = total_memory / num_runs / (1024 * 1024)
-        return avg_time, avg_memory
+        Tracing slows allocations down, so this runs separately from the
+        timed calls.
+
+        Args:
+            algorithm_func (Callable): The search function to benchmark.
+            file_path (str): Path to the file for search execution.
+            num_runs (int): Number of traced calls to average over.
+
+        Returns:
+            float: Average peak of traced allocations in megabytes (MB).
+        """
+        total_peak = 0
+        tracemalloc.start()
+        try:
+            for _ in range(num_runs):
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                algorithm_func(
+                    file_path, self.search_term, self.reread_on_query
+                )
+                total_peak += tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            tracemalloc.stop()
+        return total_peak / num_runs / (1024 * 1024)
+
+    def _inner_repeats(
+        self, algorithm_func: Callable[[str, str, bool], str], file_path: str
+    ) -> int:
+        """
+        Warm up a search and size the number of calls per timed run.
+
+        Args:
+            algorithm_func (Callable): The search function to benchmark.
+            file_path (str): Path to the file for search execution.
+
+        Returns:
+            int: Calls needed for a run to last at least `MIN_RUN_NS`.
+        """
+        start = time.perf_counter_ns()
+        algorithm_func(file_path, self.search_term, self.reread_on_query)
+        single_ns = time.perf_counter_ns() - start
+        return max(1, MIN_RUN_NS // max(single_ns, 1))
+
+    def _call_overhead_ns(self, file_path: str, inner: int) -> int:
+        """
+        Measure the cost of the timing loop around an empty search.
+
+        Args:
+            file_path (str): Path passed to the empty search.
+            inner (int): Number of calls per timed run.
+
+        Returns:
+            int: Nanoseconds spent by the loop and calls alone.
+        """
+
+        def empty_search(_path: str, _term: str, _reread: bool) -> str:
+            return ""
+
+        start = time.perf_counter_ns()
+        for _ in range(inner):
+            empty_search(file_path, self.search_term, self.reread_on_query)
+        return time.perf_counter_ns() - start
+
+    def benchmark_size(self, size: int) -> List[Tuple[int, str, float, float]]:
+        """
+        Benchmark every algorithm on a generated file of the given size.
+
+        Args:
+            size (int): Number of lines in the test file.
+
+        Returns:
+            List[Tuple[int, str, float, float]]: One result row per
+            algorithm: size, name, average time and average memory.
+        """
+        file_path = self.generate_test_file(size, f"test_file_{size}.txt")
+        with open(file_path, "rb") as f:
+            content = f.read()
+
+        rows = []
+        for name, searcher in self.algorithms:
+            logger.debug("Testing %s on %d lines", name, size)
+            avg_time, avg_mem = self.benchmark_algorithm(
+                self.search_func(searcher, content), file_path
+            )
+            rows.append((size, name, avg_time, avg_mem))
+        return rows
 
     def write_to_csv(self, filename: str) -> None:
         """
@@ -147,16 +295,19 @@ class SearchBenchmarkRunner:
         Execute benchmark tests on multiple search algorithms.
 
         Runs performance benchmarks for different search algorithms on various
-        file sizes, then saves the results to a CSV file.
-        """
-        for size in self.sizes:
-            file_path = self.generate_test_file(size, f"test_file_{size}.txt")
-            for name, searcher in self.algorithms:
-                logger.debug("Testing %s on %d lines", name, size)
-                avg_time, avg_mem = self.benchmark_algorithm(
-                    searcher.search, file_path
-                )
-                self.results.append((size, name, avg_time, avg_mem))
+        file sizes, one worker process per size, then saves the results to a
+        CSV file.
+        """
+        # Sizes are independent, so each is measured in its own process
+        # with fresh searchers, caches and garbage collector state
+        workers = min(len(self.sizes), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for rows in executor.map(
+                _benchmark_size,
+                [self.temp_dir] * len(self.sizes),
+                self.sizes,
+            ):
+                self.results.extend(rows)
 
         current_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.abspath(os.path.join(current_dir, os.pardir))
@@ -173,6 +324,22 @@ class SearchBenchmarkRunner:
         print(f"Benchmark results written to {csv_path}")
 
 
+def _benchmark_size(
+    temp_dir: str, size: int
+) -> List[Tuple[int, str, float, float]]:
+    """
+    Benchmark one file size in a worker process.
+
+    Args:
+        temp_dir (str): Directory to generate the test file in.
+        size (int): Number of lines in the test file.
+
+    Returns:
+        List[Tuple[int, str, float, float]]: The result rows for the size.
+    """
+    return SearchBenchmarkRunner(temp_dir).benchmark_size(size)
+
+
 if __name__ == "__main__":
     runner = SearchBenchmarkRunner()
     runner.run()
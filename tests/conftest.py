@@ -0,0 +1,67 @@
+"""
+Shared pytest fixtures.
+
+Provides helpers for feeding framed messages through mocked sockets.
+"""
+
+from typing import Callable, Union
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.framing import frame
+
+# A message to deliver, or an exception to raise in its place
+Delivery = Union[bytes, BaseException, type]
+
+
+@pytest.fixture
+def feed_frames() -> Callable[..., None]:
+    """
+    Return a helper that scripts `recv_into` on a mocked socket.
+
+    Each bytes item is delivered as one framed message; an exception
+    (class or instance) is raised when the reader reaches it. Once all
+    items are consumed the socket reports that the peer closed it.
+
+    Returns:
+        Callable[..., None]: Helper taking the mock and the deliveries.
+    """
+
+    def _feed(mock_socket: MagicMock, *deliveries: Delivery) -> None:
+        pending = list(deliveries)
+        stream = bytearray()
+
+        def recv_into(
+            buffer: memoryview, nbytes: int = 0, _flags: int = 0
+        ) -> int:
+            if not stream and pending:
+                item = pending.pop(0)
+                if isinstance(item, bytes):
+                    stream.extend(frame(item))
+                else:
+                    raise item
+            count = min(nbytes or len(buffer), len(stream))
+            buffer[:count] = stream[:count]
+            del stream[:count]
+            return count
+
+        mock_socket.recv_into.side_effect = recv_into
+
+    return _feed
+
+
+def sent_messages(mock_socket: MagicMock) -> list[str]:
+    """
+    Decode every framed message sent through a mocked socket.
+
+    Args:
+        mock_socket (MagicMock): Mock whose `sendall` calls are inspected.
+
+    Returns:
+        list[str]: Message bodies in the order they were sent.
+    """
+    return [
+        call.args[0][4:].decode("utf-8")
+        for call in mock_socket.sendall.call_args_list
+    ]
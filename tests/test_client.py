@@ -5,20 +5,30 @@ Includes tests for connection handling, query sending,
 and interactive session behavior.
 """
 
+import io
+import selectors
 import socket
+import sys
 from unittest.mock import MagicMock, patch
-from typing import Optional, Any
-import time
-import queue
-from itertools import cycle
+from typing import Optional, Any, Callable, Generator, Union
 
 import pytest
 
 from client.client import FileSearchClient
+from core.framing import frame
+from core.ssl_cache import client_ssl_context
 
 from core.logger import logger
 
 
+@pytest.fixture(autouse=True)
+def clear_ssl_context_cache() -> Generator[None, None, None]:
+    """Keep mocked SSL contexts from leaking into other tests."""
+    client_ssl_context.cache_clear()
+    yield
+    client_ssl_context.cache_clear()
+
+
 @pytest.fixture
 def client(monkeypatch: pytest.MonkeyPatch) -> FileSearchClient:
     """
@@ -80,7 +90,9 @@ def test_connect_returns_socket(
         )
 
 
-def test_send_query_success(client: FileSearchClient) -> None:
+def test_send_query_success(
+    client: FileSearchClient, feed_frames: Callable[..., None]
+) -> None:
     """
     Test successful query sending.
 
@@ -89,9 +101,10 @@ def test_send_query_success(client: FileSearchClient) -> None:
 
     Args:
         client (FileSearchClient): The instance being tested.
+        feed_frames (Callable): Fixture scripting framed socket reads.
     """
     mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"MATCH: Result"
+    feed_frames(mock_socket, b"MATCH: Result")
 
     latency, response = client.send_query_over_socket(
         mock_socket, "query string"
@@ -99,11 +112,12 @@ def test_send_query_success(client: FileSearchClient) -> None:
 
     assert latency is not None
     assert response == "MATCH: Result"
-    mock_socket.sendall.assert_called_once_with(b"query string")
-    mock_socket.recv.assert_called_once()
+    mock_socket.sendall.assert_called_once_with(frame(b"query string"))
 
 
-def test_send_query_server_timeout(client: FileSearchClient) -> None:
+def test_send_query_server_timeout(
+    client: FileSearchClient, feed_frames: Callable[..., None]
+) -> None:
     """
     Test query handling when the server times out.
 
@@ -111,9 +125,10 @@ def test_send_query_server_timeout(client: FileSearchClient) -> None:
 
     Args:
         client (FileSearchClient): The instance being tested.
+        feed_frames (Callable): Fixture scripting framed socket reads.
     """
     mock_socket = MagicMock()
-    mock_socket.recv.side_effect = socket.timeout("timeout")
+    feed_frames(mock_socket, socket.timeout("timeout"))
 
     latency, response = client.send_query_over_socket(mock_socket, "any")
 
@@ -121,31 +136,89 @@ def test_send_query_server_timeout(client: FileSearchClient) -> None:
     assert "ERROR" in response
 
 
+class ScriptedSelector:
+    """
+    Selector double that reports registered objects as ready in order.
+
+    Each `select` call returns the next scripted file object ("stdin" or
+    "conn"), or raises it if it is an exception.
+    """
+
+    def __init__(self, *script: Union[str, BaseException]) -> None:
+        """Store the readiness script."""
+        self.script = list(script)
+        self.keys: dict[str, selectors.SelectorKey] = {}
+
+    def register(self, fileobj: Any, events: int, data: Any) -> None:
+        """Remember the callback for the stdin and socket objects."""
+        name = "stdin" if fileobj is sys.stdin else "conn"
+        self.keys[name] = selectors.SelectorKey(fileobj, 0, events, data)
+
+    def select(
+        self, timeout: Optional[float] = None
+    ) -> list[tuple[selectors.SelectorKey, int]]:
+        """Return the next scripted ready object."""
+        del timeout
+        assert self.script, "Session did not stop when expected."
+        item = self.script.pop(0)
+        if isinstance(item, BaseException):
+            raise item
+        return [(self.keys[item], selectors.EVENT_READ)]
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def run_session(
+    client: FileSearchClient,
+    mock_socket: MagicMock,
+    user_input: str,
+    *script: Union[str, BaseException],
+) -> None:
+    """
+    Run an interactive session against scripted input and readiness.
+
+    Args:
+        client (FileSearchClient): The instance being tested.
+        mock_socket (MagicMock): Socket returned by `connect`.
+        user_input (str): Text the user types, one query per line.
+        *script (Union[str, BaseException]): Readiness script.
+    """
+    with patch.object(client, "connect", return_value=mock_socket), patch(
+        "client.client.selectors.DefaultSelector",
+        return_value=ScriptedSelector(*script),
+    ), patch("sys.stdin", io.StringIO(user_input)):
+        client.interactive_session()
+
+
 def test_interactive_session_server_timeout(
-    monkeypatch: pytest.MonkeyPatch, client: FileSearchClient
+    client: FileSearchClient,
+    feed_frames: Callable[..., None],
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """
     Test interactive session behavior when the server times out.
 
     Args:
-        monkeypatch (pytest.MonkeyPatch):
-            Fixture for modifying the environment.
         client (FileSearchClient): The instance being tested.
+        feed_frames (Callable): Fixture scripting framed socket reads.
+        capsys (pytest.CaptureFixture): Captures printed output.
     """
     mock_socket = MagicMock()
-    mock_socket.recv.side_effect = [
-        b"__TIMEOUT__: Server disconnected due to inactivity.",
-        b"",
-    ]
+    feed_frames(
+        mock_socket, b"__TIMEOUT__: Server disconnected due to inactivity."
+    )
+
+    run_session(client, mock_socket, "sample\n", "stdin", "conn")
 
-    with patch.object(client, "connect", return_value=mock_socket):
-        with patch("builtins.input", side_effect=["sample", "exit"]):
-            monkeypatch.setattr("sys.stdout.write", lambda x: None)
-            client.interactive_session()  # Should handle timeout gracefully
+    assert "Connection expired!" in capsys.readouterr().out
+    mock_socket.close.assert_called_once()
 
 
 def test_interactive_session_normal_flow(
-    monkeypatch: pytest.MonkeyPatch, client: FileSearchClient
+    client: FileSearchClient,
+    feed_frames: Callable[..., None],
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """
     Test correct behavior in an interactive session.
@@ -153,54 +226,46 @@ def test_interactive_session_normal_flow(
     Verifies response handling when receiving a normal server reply.
 
     Args:
-        monkeypatch (pytest.MonkeyPatch):
-            Fixture for modifying the environment.
         client (FileSearchClient): The instance being tested.
+        feed_frames (Callable): Fixture scripting framed socket reads.
+        capsys (pytest.CaptureFixture): Captures printed output.
     """
     mock_socket = MagicMock()
-    mock_socket.recv.side_effect = cycle([b"MATCH: Hello", b""])
+    feed_frames(mock_socket, b"MATCH: Hello\nDEBUG: details")
 
-    with patch.object(client, "connect", return_value=mock_socket):
-        with patch("builtins.input", side_effect=["Hello", "exit"]):
-            monkeypatch.setattr("sys.stdout.write", lambda x: None)
-            client.interactive_session()
-            time.sleep(0.1)
+    run_session(client, mock_socket, "Hello\nexit\n", "stdin", "conn", "stdin")
 
+    mock_socket.sendall.assert_called_once_with(frame(b"Hello"))
+    out = capsys.readouterr().out
+    assert "Server Response: MATCH: Hello" in out
+    assert "DEBUG: details" in out
+    assert "Exiting client..." in out
 
-def test_interactive_session_queue_timeout(
-    monkeypatch: pytest.MonkeyPatch, client: FileSearchClient
+
+def test_interactive_session_server_closed(
+    client: FileSearchClient,
+    feed_frames: Callable[..., None],
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """
-    Test queue timeout handling in an interactive session.
+    Test that the session ends when the server closes the connection.
 
-    Ensures the client properly handles when no response
-    is received within the expected time frame.
+    Args:
+        client (FileSearchClient): The instance being tested.
+        feed_frames (Callable): Fixture scripting framed socket reads.
+        capsys (pytest.CaptureFixture): Captures printed output.
     """
     mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"MATCH: Dummy"
-
-    class DummyQueue(queue.Queue):
-        """
-        A mock queue that always raises `queue.Empty` when `get()` is called.
-
-        This simulates a timeout scenario for testing purposes.
-        """
+    feed_frames(mock_socket)
 
-        def get(
-            self, block: bool = True, timeout: Optional[float] = None
-        ) -> Any:
-            """Simulate queue timeout by always raising `queue.Empty`."""
-            raise queue.Empty()
+    run_session(client, mock_socket, "", "conn")
 
-    with patch.object(client, "connect", return_value=mock_socket), patch(
-        "builtins.input", side_effect=["TimeoutTest", "exit"]
-    ), patch("client.client.queue.Queue", DummyQueue):
-        monkeypatch.setattr("sys.stdout.write", lambda x: None)
-        client.interactive_session()
+    assert "Server closed the connection." in capsys.readouterr().out
 
 
 def test_interactive_session_keyboard_interrupt(
-    monkeypatch: pytest.MonkeyPatch, client: FileSearchClient
+    client: FileSearchClient,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """
     Test client behavior when a KeyboardInterrupt occurs.
@@ -210,22 +275,20 @@ def test_interactive_session_keyboard_interrupt(
     exception gracefully without crashing.
 
     Args:
-        monkeypatch (pytest.MonkeyPatch):
-            Fixture for modifying environment behavior.
         client (FileSearchClient): The instance being tested.
+        capsys (pytest.CaptureFixture): Captures printed output.
     """
     mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"MATCH: Dummy"
 
-    with patch.object(client, "connect", return_value=mock_socket), patch(
-        "builtins.input", side_effect=KeyboardInterrupt
-    ):
-        monkeypatch.setattr("sys.stdout.write", lambda x: None)
-        client.interactive_session()
+    run_session(client, mock_socket, "", KeyboardInterrupt())
+
+    assert "Interrupted by user" in capsys.readouterr().out
+    mock_socket.close.assert_called_once()
 
 
 def test_interactive_session_shutdown_exception(
-    monkeypatch: pytest.MonkeyPatch, client: FileSearchClient
+    client: FileSearchClient,
+    feed_frames: Callable[..., None],
 ) -> None:
     """
     Test client behavior when a shutdown exception occurs.
@@ -235,29 +298,29 @@ def test_interactive_session_shutdown_exception(
     handles the error gracefully without crashing.
 
     Args:
-        monkeypatch (pytest.MonkeyPatch):
-            Fixture for modifying environment behavior.
         client (FileSearchClient): The instance being tested.
+        feed_frames (Callable): Fixture scripting framed socket reads.
     """
     mock_socket = MagicMock()
-    mock_socket.recv.side_effect = [b"MATCH: Hello", b""]
+    feed_frames(mock_socket, b"MATCH: Hello")
     mock_socket.shutdown.side_effect = Exception("Shutdown error")
 
-    with patch.object(client, "connect", return_value=mock_socket), patch(
-        "builtins.input", side_effect=["Hello", "exit"]
-    ), patch.object(logger, "warning") as mock_log:
-        monkeypatch.setattr("sys.stdout.write", lambda x: None)
-        client.interactive_session()
+    with patch.object(logger, "warning") as mock_log:
+        run_session(
+            client, mock_socket, "Hello\nexit\n", "stdin", "conn", "stdin"
+        )
 
         mock_log.assert_called_with(
             "Exception occurred during shutdown: %s", "Shutdown error"
         )
 
 
-def test_network_disconnection(client: FileSearchClient) -> None:
+def test_network_disconnection(
+    client: FileSearchClient, feed_frames: Callable[..., None]
+) -> None:
     """Test client behavior when network disconnects mid-query."""
     mock_socket = MagicMock()
-    mock_socket.recv.side_effect = socket.error("Mock disconnect")
+    feed_frames(mock_socket, socket.error("Mock disconnect"))
 
     latency, response = client.send_query_over_socket(
         mock_socket, "test query"
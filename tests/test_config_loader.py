@@ -0,0 +1,79 @@
+"""
+Unit tests for the config loader.
+
+Verifies value parsing and that the parsed YAML is cached until the
+file changes.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from core import config_loader
+from core.config_loader import get_config_value, parse_config_value
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    """Create a temporary YAML config file."""
+    file = tmp_path / "config.yaml"
+    file.write_text('reread: "false"\nserver_port: 5000\n', encoding="utf-8")
+    return file
+
+
+def test_get_config_value_parses_and_defaults(config_file: Path) -> None:
+    """
+    Verify that values are parsed and missing keys fall back to default.
+
+    Args:
+        config_file (Path): Temporary YAML config file.
+    """
+    assert get_config_value(str(config_file), "reread") is False
+    assert get_config_value(str(config_file), "server_port") == 5000
+    assert get_config_value(str(config_file), "missing", default=7) == 7
+
+
+def test_get_config_value_is_cached_until_modified(config_file: Path) -> None:
+    """
+    Verify that the file is parsed once and reparsed after it changes.
+
+    Args:
+        config_file (Path): Temporary YAML config file.
+    """
+    load_config = config_loader._load_config  # pylint: disable=W0212
+    load_config.cache_clear()
+
+    get_config_value(str(config_file), "reread")
+    get_config_value(str(config_file), "server_port")
+    info = load_config.cache_info()  # pylint: disable=E1120
+    assert info.misses == 1
+
+    config_file.write_text("server_port: 6000\n", encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert get_config_value(str(config_file), "server_port") == 6000
+
+
+def test_get_config_value_missing_file_returns_default(tmp_path: Path) -> None:
+    """
+    Verify that an unreadable config file yields the default value.
+
+    Args:
+        tmp_path (Path): Pytest temporary directory.
+    """
+    missing = tmp_path / "missing.yaml"
+    assert get_config_value(str(missing), "server_port", default=1) == 1
+
+
+def test_parse_config_value_resolves_paths_and_keeps_other_values() -> None:
+    """Verify path resolution and that non-string values pass through."""
+    project_root = Path(config_loader.__file__).resolve().parent.parent
+
+    assert parse_config_value("certs/ca.crt") == str(
+        project_root / "certs" / "ca.crt"
+    )
+    assert parse_config_value("/tmp/../data.txt") == "/data.txt"
+    assert parse_config_value("No") is False
+    assert parse_config_value(["a", "b"]) == ["a", "b"]
@@ -3,19 +3,31 @@ Unit tests for ClientHandler.
 
 NOTE:
 These tests do NOT require a real configuration file.
-All calls to `get_config_value` are mocked to return test-specific values.
+The module-level `SERVER_SETTINGS` snapshot is patched with test-specific
+values.
 
 This allows tests to run in isolation and avoids external dependencies.
 """
 
+import asyncio
 import socket
 from pathlib import Path
+from typing import Callable
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from core.connection_handler import ClientHandler, SEARCH_CLASSES
+from core.connection_handler import (
+    ALGORITHM_IDS,
+    AsyncClientHandler,
+    ClientHandler,
+    SEARCH_CLASSES,
+)
+from core.framing import frame, read_msg
+from core.protocol import HELLO_BINARY, STATUS_CODES, unpack_reply
 from core.search_algorithms.mmap_search import MmapSearcher
+from core.search_algorithms.set_based_searcher import SetBasedSearcher
+from tests.conftest import sent_messages
 
 
 @pytest.fixture
@@ -33,7 +45,9 @@ def tmp_file(tmp_path: Path) -> Path:
 
 
 def test_handler_processes_query_and_sends_response(
-    mock_socket: MagicMock, tmp_file: Path
+    mock_socket: MagicMock,
+    tmp_file: Path,
+    feed_frames: Callable[..., None],
 ) -> None:
     """
     Process a valid query and send the result.
@@ -41,21 +55,22 @@ def test_handler_processes_query_and_sends_response(
     Args:
         mock_socket (MagicMock): Mocked socket instance.
         tmp_file (Path): Temporary file with sample data.
+        feed_frames (Callable): Fixture scripting framed socket reads.
     """
     query = "Find me"
     reread = False
-    mock_socket.recv.side_effect = [query.encode(), b""]
+    feed_frames(mock_socket, query.encode())
 
-    # Mock config values
-    with patch("core.connection_handler.get_config_value") as mock_cfg:
-        # Mock config values to avoid relying on real config file
-        mock_cfg.side_effect = lambda *_args, **_kwargs: {
+    # Mock config values to avoid relying on real config file
+    with patch.dict(
+        "core.connection_handler.SERVER_SETTINGS",
+        {
             "client_timeout_time": 10,
             "linuxpath": str(tmp_file),
             "reread": reread,
             "search_algorithm": "mmap",
-        }[_args[1]]
-
+        },
+    ):
         selected_class = SEARCH_CLASSES["mmap"]
 
         with patch.object(
@@ -65,38 +80,111 @@ def test_handler_processes_query_and_sends_response(
             handler.handle()
 
             mock_search.assert_called_once_with(str(tmp_file), query, reread)
-            sent_data = mock_socket.send.call_args[0][0].decode()
+            sent_data = sent_messages(mock_socket)[-1]
             assert "MATCH: Find me" in sent_data
 
 
-def test_handler_timeout_disconnects_client(mock_socket: MagicMock) -> None:
+def test_handler_sends_binary_replies_after_hello(
+    mock_socket: MagicMock,
+    tmp_file: Path,
+    feed_frames: Callable[..., None],
+) -> None:
+    """
+    Verify that a binary hello switches replies to packed metadata.
+
+    Args:
+        mock_socket (MagicMock): Mocked socket instance.
+        tmp_file (Path): Temporary file with sample data.
+        feed_frames (Callable): Fixture scripting framed socket reads.
+    """
+    feed_frames(mock_socket, HELLO_BINARY, b"Find me")
+
+    with patch.dict(
+        "core.connection_handler.SERVER_SETTINGS",
+        {
+            "client_timeout_time": 10,
+            "linuxpath": str(tmp_file),
+            "reread": True,
+            "search_algorithm": "mmap",
+        },
+    ):
+        handler = ClientHandler(mock_socket, ("127.0.0.1", 5050))
+        handler.handle()
+
+    # Only the search reply is sent; the hello itself is not answered
+    mock_socket.sendall.assert_called_once()
+    meta = unpack_reply(mock_socket.sendall.call_args.args[0][4:])
+    assert meta.status == STATUS_CODES["STRING EXISTS"]
+    assert meta.algorithm_id == ALGORITHM_IDS["mmap"]
+    assert meta.query == b"Find me"
+    assert meta.exec_time_ns > 0
+
+
+def test_binary_reply_echoes_queries_over_64_kib(
+    mock_socket: MagicMock,
+    tmp_file: Path,
+    feed_frames: Callable[..., None],
+) -> None:
+    """
+    Verify that a query longer than 65535 bytes gets a binary reply.
+
+    Args:
+        mock_socket (MagicMock): Mocked socket instance.
+        tmp_file (Path): Temporary file with sample data.
+        feed_frames (Callable): Fixture scripting framed socket reads.
+    """
+    query = b"q" * 70_000
+    feed_frames(mock_socket, HELLO_BINARY, query)
+
+    with patch.dict(
+        "core.connection_handler.SERVER_SETTINGS",
+        {
+            "client_timeout_time": 10,
+            "linuxpath": str(tmp_file),
+            "reread": True,
+            "search_algorithm": "mmap",
+        },
+    ):
+        ClientHandler(mock_socket, ("127.0.0.1", 5050)).handle()
+
+    meta = unpack_reply(mock_socket.sendall.call_args.args[0][4:])
+    assert meta.status == STATUS_CODES["STRING NOT FOUND"]
+    assert meta.query == query
+
+
+def test_handler_timeout_disconnects_client(
+    mock_socket: MagicMock, feed_frames: Callable[..., None]
+) -> None:
     """
     Ensure a timeout results in the correct message being sent.
 
     Args:
         mock_socket (MagicMock): Mocked socket instance.
+        feed_frames (Callable): Fixture scripting framed socket reads.
     """
-    mock_socket.recv.side_effect = socket.timeout
+    feed_frames(mock_socket, socket.timeout)
 
-    # Mock config values
-    with patch("core.connection_handler.get_config_value") as mock_cfg:
-        # Mock config values to avoid relying on real config file
-        mock_cfg.side_effect = lambda *_args, **_kwargs: {
+    # Mock config values to avoid relying on real config file
+    with patch.dict(
+        "core.connection_handler.SERVER_SETTINGS",
+        {
             "client_timeout_time": 5,
             "linuxpath": "/fake/path.txt",
             "reread": True,
             "search_algorithm": "mmap",
-        }[_args[1]]
-
+        },
+    ):
         handler = ClientHandler(mock_socket, ("127.0.0.1", 5050))
         handler.handle()
 
-        sent_data = mock_socket.send.call_args[0][0].decode()
+        sent_data = sent_messages(mock_socket)[-1]
         assert "__TIMEOUT__" in sent_data
 
 
 def test_handler_uses_correct_search_algorithm(
-    mock_socket: MagicMock, tmp_file: Path
+    mock_socket: MagicMock,
+    tmp_file: Path,
+    feed_frames: Callable[..., None],
 ) -> None:
     """
     Verify that the correct search algorithm is selected and used.
@@ -104,26 +192,87 @@ def test_handler_uses_correct_search_algorithm(
     Args:
         mock_socket (MagicMock): Mocked socket instance.
         tmp_file (Path): Temporary file with sample data.
+        feed_frames (Callable): Fixture scripting framed socket reads.
     """
-    mock_socket.recv.side_effect = [b"Look here", b""]
+    feed_frames(mock_socket, b"Look here")
 
-    with patch("core.connection_handler.get_config_value") as mock_cfg, patch(
+    # Mock config values to avoid relying on real config file
+    with patch.dict(
+        "core.connection_handler.SERVER_SETTINGS",
+        {
+            "client_timeout_time": 5,
+            "linuxpath": str(tmp_file),
+            "reread": True,
+            "search_algorithm": "mmap",
+        },
+    ), patch(
         "core.connection_handler.SEARCH_CLASSES",
         {"mmap": MmapSearcher},
     ), patch.object(
         MmapSearcher, "search", return_value="MATCH: Look here"
     ) as mock_search:
-        # Mock config values to avoid relying on real config file
-        mock_cfg.side_effect = lambda *_args, **_kwargs: {
-            "client_timeout_time": 5,
-            "linuxpath": str(tmp_file),
-            "reread": True,
-            "search_algorithm": "mmap",
-        }[_args[1]]
-
         handler = ClientHandler(mock_socket, ("127.0.0.1", 8080))
         handler.handle()
 
         mock_search.assert_called_once_with(str(tmp_file), "Look here", True)
-        sent_data = mock_socket.send.call_args[0][0].decode()
+        sent_data = sent_messages(mock_socket)[-1]
         assert "MATCH: Look here" in sent_data
+
+
+def test_handlers_share_configured_searcher(mock_socket: MagicMock) -> None:
+    """
+    Verify that the configured algorithm is used and shared by handlers.
+
+    Args:
+        mock_socket (MagicMock): Mocked socket instance.
+    """
+    with patch.dict(
+        "core.connection_handler.SERVER_SETTINGS",
+        {"search_algorithm": "set"},
+    ):
+        first = ClientHandler(mock_socket, ("127.0.0.1", 5050))
+        second = ClientHandler(mock_socket, ("127.0.0.1", 5051))
+
+    assert isinstance(first.searcher, SetBasedSearcher)
+    assert first.searcher is second.searcher
+
+
+def test_async_handler_serves_queries_over_streams(tmp_file: Path) -> None:
+    """
+    Verify that the asyncio handler answers framed queries on a loop.
+
+    Args:
+        tmp_file (Path): Temporary file with sample data.
+    """
+
+    async def scenario() -> list[bytes]:
+        async def handle(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            await AsyncClientHandler(reader, writer).handle_async()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(frame(HELLO_BINARY) + frame(b"Find me"))
+            writer.write(frame(b"\xff"))
+            replies = [await read_msg(reader) for _ in range(3)]
+            writer.close()
+            await writer.wait_closed()
+        return [reply or b"" for reply in replies]
+
+    with patch.dict(
+        "core.connection_handler.SERVER_SETTINGS",
+        {
+            "client_timeout_time": 5,
+            "linuxpath": str(tmp_file),
+            "reread": True,
+            "search_algorithm": "mmap",
+        },
+    ):
+        found, error, closed = asyncio.run(scenario())
+
+    assert unpack_reply(found).status == STATUS_CODES["STRING EXISTS"]
+    assert error.startswith(b"ERROR:")
+    assert closed == b""
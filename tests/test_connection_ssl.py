@@ -5,12 +5,13 @@ This module tests mutual TLS authentication, logging behavior,
 and handling of invalid certificates.
 """
 
-import subprocess
-import time
+import threading
 
 from unittest.mock import patch
 from unittest.mock import MagicMock
 
+import os
+import shutil
 from pathlib import Path
 from typing import Generator
 import ssl
@@ -19,8 +20,11 @@ import pytest
 from pytest import MonkeyPatch
 
 from client.client import FileSearchClient
+from core.ssl_wrapper import SSLSocketWrapper
+from tests.test_ssl_server import run_ssl_server
 
-SERVER_SCRIPT = Path("tests/test_ssl_server.py")
+# Seconds the test server gets to start listening
+SERVER_START_TIMEOUT = 5.0
 
 
 @pytest.fixture(autouse=True)
@@ -59,34 +63,28 @@ def _start_test_server() -> Generator[None, None, None]:
         None: Server fixture cleanup after tests.
     """
     cert_dir = Path("tests/certs")
+    stop_event, ready = threading.Event(), threading.Event()
 
-    with subprocess.Popen(
-        [
-            "python",
-            str(SERVER_SCRIPT),
+    # Served from a thread of the test process; no interpreter to start
+    server = threading.Thread(
+        target=run_ssl_server,
+        args=(
             str(cert_dir / "server.crt"),
             str(cert_dir / "server.key"),
             str(cert_dir / "ca.pem"),
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    ) as server_proc:
-        time.sleep(1)
-
-        if server_proc.poll() is not None:
-            stderr_output = (
-                server_proc.stderr.read().decode()
-                if server_proc.stderr
-                else "Unknown error"
-            )
-            raise RuntimeError(
-                f"Test server failed to start:\n{stderr_output}"
-            )
+        ),
+        kwargs={"stop_event": stop_event, "ready": ready},
+        daemon=True,
+    )
+    server.start()
+    if not ready.wait(SERVER_START_TIMEOUT):
+        stop_event.set()
+        raise RuntimeError("Test server failed to start.")
 
-        yield
+    yield
 
-        server_proc.terminate()
-        server_proc.wait()
+    stop_event.set()
+    server.join()
 
 
 # Fixture with intentionally invalid cert
@@ -124,7 +122,6 @@ def test_connection_with_wrong_cert(_start_test_server: None) -> None:
         conn = client.connect()
         if conn is None:
             raise ssl.SSLError("SSL connection setup failed")
-        conn.connect((client.host, client.port))
 
 
 def test_mtls_rejects_invalid_client(
@@ -144,9 +141,6 @@ def test_mtls_rejects_invalid_client(
         conn = client_with_invalid_cert.connect()
         if conn is None:
             raise ssl.SSLError("SSL connection setup failed")
-        conn.connect(
-            (client_with_invalid_cert.host, client_with_invalid_cert.port)
-        )
 
 
 @patch("client.client.logger")
@@ -191,10 +185,35 @@ def test_successful_ssl_connection(_start_test_server: None) -> None:
     client.client_key = "tests/certs/client.key"
     client.server_cert = "tests/certs/ca.pem"
 
+    # Connect, complete the handshake and send dummy data
     conn = client.connect()
     assert conn is not None
-
-    # Establish connection and send dummy data
-    conn.connect((client.host, client.port))
     conn.send(b"Hello test server!")
     conn.close()
+
+
+def test_ssl_wrapper_reuses_context_until_files_change(
+    tmp_path: Path,
+) -> None:
+    """
+    Test that wrappers for the same certificates share one SSL context.
+
+    A new context is built once a certificate file is modified.
+
+    Args:
+        tmp_path (Path): Temporary directory for copied certificates.
+    """
+    for name in ("server.crt", "server.key", "ca.pem"):
+        shutil.copy(Path("tests/certs") / name, tmp_path / name)
+    certfile = str(tmp_path / "server.crt")
+    keyfile = str(tmp_path / "server.key")
+    ca_bundle = str(tmp_path / "ca.pem")
+
+    first = SSLSocketWrapper(certfile, keyfile, ca_bundle)
+    second = SSLSocketWrapper(certfile, keyfile, ca_bundle)
+    assert second.context is first.context
+
+    stat = os.stat(certfile)
+    os.utime(certfile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    third = SSLSocketWrapper(certfile, keyfile, ca_bundle)
+    assert third.context is not first.context
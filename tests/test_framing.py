@@ -0,0 +1,109 @@
+"""
+Unit tests for message framing.
+
+Uses connected socket pairs so that real partial reads and closed
+connections are exercised.
+"""
+
+import asyncio
+import socket
+import threading
+from typing import Optional
+
+import pytest
+
+from core.framing import (
+    HEADER,
+    MAX_FRAME_SIZE,
+    frame,
+    read_msg,
+    recv_msg,
+    send_msg,
+)
+
+
+def test_round_trip_several_messages() -> None:
+    """Verify that consecutive messages arrive whole and in order."""
+    left, right = socket.socketpair()
+    with left, right:
+        for payload in (b"first", b"", "größe".encode("utf-8")):
+            send_msg(left, payload)
+        assert recv_msg(right) == b"first"
+        assert recv_msg(right) == b""
+        assert recv_msg(right) == "größe".encode("utf-8")
+
+
+def test_recv_msg_reassembles_split_writes() -> None:
+    """Verify that a message sent in small pieces is reassembled."""
+    left, right = socket.socketpair()
+    data = frame(b"x" * 10_000)
+
+    def trickle() -> None:
+        view = memoryview(data)
+        while view:
+            left.sendall(view[:7])
+            view = view[7:]
+
+    with left, right:
+        sender = threading.Thread(target=trickle)
+        sender.start()
+        assert recv_msg(right) == b"x" * 10_000
+        sender.join()
+
+
+def test_messages_outlive_the_reused_buffer() -> None:
+    """Verify that a received message is not overwritten by the next."""
+    left, right = socket.socketpair()
+    large = b"y" * (MAX_FRAME_SIZE // 2)
+
+    def send_all() -> None:
+        for payload in (b"one", large, b"2"):
+            send_msg(left, payload)
+
+    with left, right:
+        sender = threading.Thread(target=send_all)
+        sender.start()
+        first = recv_msg(right)
+        assert recv_msg(right) == large
+        assert recv_msg(right) == b"2"
+        assert first == b"one"
+        sender.join()
+
+
+def test_recv_msg_returns_none_on_clean_close() -> None:
+    """Verify that a close between messages is reported as None."""
+    left, right = socket.socketpair()
+    with right:
+        left.close()
+        assert recv_msg(right) is None
+
+
+def test_recv_msg_raises_on_truncated_message() -> None:
+    """Verify that a close in the middle of a message is an error."""
+    left, right = socket.socketpair()
+    with right:
+        left.sendall(frame(b"complete")[:-2])
+        left.close()
+        with pytest.raises(ConnectionError):
+            recv_msg(right)
+
+
+def test_recv_msg_rejects_oversized_frame() -> None:
+    """Verify that a header announcing too large a payload is refused."""
+    left, right = socket.socketpair()
+    with left, right:
+        left.sendall(HEADER.pack(MAX_FRAME_SIZE + 1))
+        with pytest.raises(ValueError):
+            recv_msg(right)
+
+
+def test_read_msg_from_stream() -> None:
+    """Verify framed reads from an asyncio stream."""
+
+    async def scenario() -> list[Optional[bytes]]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(frame(b"hello") + frame(b"world"))
+        reader.feed_eof()
+        return [await read_msg(reader) for _ in range(3)]
+
+    assert asyncio.run(scenario()) == [b"hello", b"world", None]
@@ -5,19 +5,28 @@ Verifies correct behavior for different
 searchers using various test cases.
 """
 
+import os
+import threading
 from typing import Type, Callable, Any, List
 from pathlib import Path
 
 import pytest
 
 # Import searcher classes
+from core.search_algorithms import line_by_line
 from core.search_algorithms.line_by_line import LineByLineSearcher
 from core.search_algorithms.mmap_search import MmapSearcher
 from core.search_algorithms.buffered_chunk_search import BufferedChunkSearcher
+from core.search_algorithms import regex_line_search
 from core.search_algorithms.regex_line_search import RegexLineSearcher
 from core.search_algorithms.trie_search import TrieBasedSearcher
 from core.search_algorithms.cached_line_search import CachedLineSearcher
 from core.search_algorithms.set_based_searcher import SetBasedSearcher
+from core.search_algorithms.c_mmap_search import CMmapSearcher
+from core.search_algorithms import aho_corasick_search
+from core.search_algorithms.aho_corasick_search import AhoCorasickSearcher
+from core.search_algorithms.line_match import contains_line
+from core.search_algorithms.protocols import BytesSearchProtocol
 
 # List of all searcher classes to be tested
 SEARCHERS: List[Type[Any]] = [
@@ -28,6 +37,8 @@ SEARCHERS: List[Type[Any]] = [
     TrieBasedSearcher,
     CachedLineSearcher,
     SetBasedSearcher,
+    CMmapSearcher,
+    AhoCorasickSearcher,
 ]
 
 
@@ -44,18 +55,37 @@ def temp_test_file(tmp_path: Path) -> Callable[[List[str], str], str]:
     return _make_file
 
 
+@pytest.fixture(scope="session")
+def shared_test_file(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[List[str], str], str]:
+    """Create a read-only test file once per session for given lines."""
+    files: dict[tuple[tuple[str, ...], str], str] = {}
+
+    def _get_file(lines: List[str], filename: str = "test_file.txt") -> str:
+        key = (tuple(lines), filename)
+        if key not in files:
+            file_path = tmp_path_factory.mktemp("shared") / filename
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            files[key] = str(file_path)
+        return files[key]
+
+    return _get_file
+
+
 @pytest.mark.parametrize("searcher_cls", SEARCHERS)
 def test_search_finds_match(
-    searcher_cls: Type[Any], temp_test_file: Callable[[List[str], str], str]
+    searcher_cls: Type[Any], shared_test_file: Callable[[List[str], str], str]
 ) -> None:
     """
     Verify that the search function correctly finds a match.
 
     Args:
         searcher_cls (Type[Any]): Search algorithm class to test.
-        temp_test_file (Callable): Fixture function to create test files.
+        shared_test_file (Callable): Fixture function to get test files.
     """
-    file_path = temp_test_file(
+    file_path = shared_test_file(
         ["Hello World\n", "Search Target\n", "End\n"], "test_file.txt"
     )
     searcher = searcher_cls()
@@ -68,16 +98,18 @@ def test_search_finds_match(
 
 @pytest.mark.parametrize("searcher_cls", SEARCHERS)
 def test_search_returns_no_match(
-    searcher_cls: Type[Any], temp_test_file: Callable[[List[str], str], str]
+    searcher_cls: Type[Any], shared_test_file: Callable[[List[str], str], str]
 ) -> None:
     """
     Verify that the search function correctly returns no match.
 
     Args:
         searcher_cls (Type[Any]): Search algorithm class to test.
-        temp_test_file (Callable): Fixture function to create test files.
+        shared_test_file (Callable): Fixture function to get test files.
     """
-    file_path = temp_test_file(["Hello\n", "Nothing here\n"], "test_file.txt")
+    file_path = shared_test_file(
+        ["Hello\n", "Nothing here\n"], "test_file.txt"
+    )
     searcher = searcher_cls()
     result = searcher.search(file_path, "Nonexistent String", True)
 
@@ -88,16 +120,16 @@ def test_search_returns_no_match(
 
 @pytest.mark.parametrize("searcher_cls", SEARCHERS)
 def test_search_empty_file(
-    searcher_cls: Type[Any], temp_test_file: Callable[[List[str], str], str]
+    searcher_cls: Type[Any], shared_test_file: Callable[[List[str], str], str]
 ) -> None:
     """
     Verify search behavior for an empty file.
 
     Args:
         searcher_cls (Type[Any]): Search algorithm class to test.
-        temp_test_file (Callable): Fixture function to create test files.
+        shared_test_file (Callable): Fixture function to get test files.
     """
-    file_path = temp_test_file([], "test_file.txt")
+    file_path = shared_test_file([], "test_file.txt")
     searcher = searcher_cls()
     result = searcher.search(file_path, "Anything", True)
 
@@ -108,7 +140,7 @@ def test_search_empty_file(
 
 @pytest.mark.parametrize("searcher_cls", SEARCHERS)
 def test_search_does_not_reread_if_cached(
-    searcher_cls: Type[Any], temp_test_file: Callable[[List[str], str], str]
+    searcher_cls: Type[Any], shared_test_file: Callable[[List[str], str], str]
 ) -> None:
     """
     Verify that reread=False prevents reloading for caching search algorithms.
@@ -118,9 +150,9 @@ def test_search_does_not_reread_if_cached(
 
     Args:
         searcher_cls (Type[Any]): Search algorithm class to test.
-        temp_test_file (Callable): Fixture function to create test files.
+        shared_test_file (Callable): Fixture function to get test files.
     """
-    file_path = temp_test_file(["Cached Line\n"], "test_file.txt")
+    file_path = shared_test_file(["Cached Line\n"], "test_file.txt")
     searcher = searcher_cls()
     result1 = searcher.search(file_path, "Cached", True)
     result2 = searcher.search(file_path, "Cached", False)
@@ -128,3 +160,280 @@ def test_search_does_not_reread_if_cached(
     assert (
         result1 == result2
     ), f"{searcher_cls.__name__} reread=False gave different result."
+
+
+@pytest.mark.parametrize("searcher_cls", [MmapSearcher, SetBasedSearcher])
+def test_search_cache_follows_file_changes(
+    searcher_cls: Type[Any],
+    temp_test_file: Callable[[List[str], str], str],
+) -> None:
+    """
+    Verify that cached lines are rebuilt when the file changes on disk.
+
+    Args:
+        searcher_cls (Type[Any]): Searcher class keyed on file metadata.
+        temp_test_file (Callable): Fixture to create a test file.
+    """
+    file_path = temp_test_file(["alpha\n"], "changing.txt")
+    searcher = searcher_cls()
+    assert searcher.search(file_path, "beta") == "STRING NOT FOUND"
+
+    with open(file_path, "a", encoding="utf-8") as f:
+        f.write("beta\n")
+    assert searcher.search(file_path, "beta") == "STRING EXISTS"
+
+
+def test_line_set_is_shared_across_searchers(
+    temp_test_file: Callable[[List[str], str], str],
+) -> None:
+    """
+    Verify that searchers of different classes share one line set.
+
+    Args:
+        temp_test_file (Callable): Fixture to create a test file.
+    """
+    file_path = temp_test_file(["alpha\n", "beta\n"], "shared.txt")
+    set_searcher, mmap_searcher = SetBasedSearcher(), MmapSearcher()
+    regex_searcher = RegexLineSearcher()
+    for searcher in (set_searcher, mmap_searcher, regex_searcher):
+        assert searcher.search(file_path, "beta") == "STRING EXISTS"
+
+    assert set_searcher.cached_set is mmap_searcher.line_cache
+    assert set_searcher.cached_set is regex_searcher.line_set
+
+
+@pytest.mark.parametrize("searcher_cls", [MmapSearcher, RegexLineSearcher])
+def test_reread_uses_line_set_of_unchanged_file(
+    searcher_cls: Type[Any],
+    temp_test_file: Callable[[List[str], str], str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Verify that a reread is answered from lines cached for the same file.
+
+    Args:
+        searcher_cls (Type[Any]): Searcher class sharing the line sets.
+        temp_test_file (Callable): Fixture to create a test file.
+        monkeypatch (pytest.MonkeyPatch): Used to fail any file read.
+    """
+    file_path = temp_test_file(["alpha\n"], "unchanged.txt")
+    searcher = searcher_cls()
+    assert searcher.search(file_path, "alpha") == "STRING EXISTS"
+
+    def no_read(*_args: Any) -> None:
+        raise AssertionError("unchanged file was read again")
+
+    monkeypatch.setattr(searcher_cls, "_get_mmap", no_read, raising=False)
+    monkeypatch.setattr(regex_line_search, "open_sequential", no_read)
+    assert searcher.search(file_path, "alpha", True) == "STRING EXISTS"
+
+    with open(file_path, "a", encoding="utf-8") as f:
+        f.write("beta\n")
+    monkeypatch.undo()
+    assert searcher.search(file_path, "beta", True) == "STRING EXISTS"
+
+
+def test_cached_line_search_sees_changes_on_reread(
+    temp_test_file: Callable[[List[str], str], str],
+) -> None:
+    """
+    Verify that cached lines are kept until the file is reread.
+
+    Args:
+        temp_test_file (Callable): Fixture to create a test file.
+    """
+    file_path = temp_test_file(["alpha\n"], "cached.txt")
+    searcher = CachedLineSearcher()
+    assert searcher.search(file_path, "beta") == "STRING NOT FOUND"
+
+    with open(file_path, "a", encoding="utf-8") as f:
+        f.write("beta\n")
+    assert searcher.search(file_path, "beta") == "STRING NOT FOUND"
+    assert searcher.search(file_path, "beta", True) == "STRING EXISTS"
+
+
+@pytest.mark.parametrize("reread", [True, False])
+@pytest.mark.parametrize("searcher_cls", SEARCHERS)
+def test_search_does_not_match_across_lines(
+    searcher_cls: Type[Any],
+    reread: bool,
+    temp_test_file: Callable[[List[str], str], str],
+) -> None:
+    """
+    Verify that a query holding a line break never spans two lines.
+
+    Args:
+        searcher_cls (Type[Any]): Searcher class to test.
+        reread (bool): Whether to reread the file on the query.
+        temp_test_file (Callable): Fixture to create a test file.
+    """
+    file_path = temp_test_file(["a\n", "b\r\n", "c\n"], "breaks.txt")
+    searcher = searcher_cls()
+    for query in ("a\nb", "b\r\nc", "b\r", "a\n"):
+        assert searcher.search(file_path, query, reread) == "STRING NOT FOUND"
+    assert searcher.search(file_path, "b", reread) == "STRING EXISTS"
+
+
+@pytest.mark.parametrize("reread", [True, False])
+@pytest.mark.parametrize("searcher_cls", SEARCHERS)
+def test_search_ends_lines_at_every_break(
+    searcher_cls: Type[Any], reread: bool, tmp_path: Path
+) -> None:
+    """
+    Verify that "\\r" and "\\r\\n" end lines just like "\\n" does.
+
+    Args:
+        searcher_cls (Type[Any]): Searcher class to test.
+        reread (bool): Whether to reread the file on the query.
+        tmp_path (Path): Pytest temporary directory.
+    """
+    file_path = tmp_path / "breaks.txt"
+    file_path.write_bytes(b"a\rb\n c \r\nd\r\re\r")
+    searcher = searcher_cls()
+    for query in ("a", "b", "c", "d", "e"):
+        assert searcher.search(str(file_path), query, reread) == (
+            "STRING EXISTS"
+        )
+    for query in ("a\rb", "ab", "x"):
+        assert searcher.search(str(file_path), query, reread) == (
+            "STRING NOT FOUND"
+        )
+    # The blank line between "d" and "e"; none sits inside "\r\n"
+    assert searcher.search(str(file_path), "", reread) == "STRING EXISTS"
+
+
+@pytest.mark.parametrize(
+    "searcher_cls",
+    [cls for cls in SEARCHERS if issubclass(cls, BytesSearchProtocol)],
+)
+def test_search_bytes_matches_whole_lines(searcher_cls: Type[Any]) -> None:
+    """
+    Verify that in-memory searches match only whole, stripped lines.
+
+    Args:
+        searcher_cls (Type[Any]): Searcher class implementing search_bytes.
+    """
+    searcher = searcher_cls()
+    data = b"alpha\n  beta \nalphabet\ngamma"
+    assert searcher.search_bytes(data, b"beta") == "STRING EXISTS"
+    assert searcher.search_bytes(data, b"gamma") == "STRING EXISTS"
+    assert searcher.search_bytes(data, b"alph") == "STRING NOT FOUND"
+    assert searcher.search_bytes(b"", b"alpha") == "STRING NOT FOUND"
+
+
+@pytest.mark.parametrize(
+    ("data", "needle", "expected"),
+    [
+        (b"a\r\nbeta\r\n", b"beta", True),
+        (b"a\n \tbeta \x0b\n", b"beta", True),
+        (b"betamax\nalphabeta\n", b"beta", False),
+        (b"\t\n", b"\t", False),
+        (b"a\n beta\n", b" beta", False),
+        (b"a\n\r\nb", b"", True),
+        (b"a\r\nb", b"", False),
+        (b"a\rbeta\rc", b"beta", True),
+        (b"a\r beta\r\n", b"beta", True),
+    ],
+)
+def test_contains_line_compares_stripped_lines(
+    data: bytes, needle: bytes, expected: bool
+) -> None:
+    """
+    Verify line matching across line endings and surrounding whitespace.
+
+    Args:
+        data (bytes): Raw file content.
+        needle (bytes): Encoded search string.
+        expected (bool): Whether a stripped line equals the needle.
+    """
+    assert contains_line(data, needle) is expected
+
+
+@pytest.mark.parametrize("automaton", [True, False])
+def test_aho_corasick_matches_only_whole_lines(
+    automaton: bool,
+    temp_test_file: Callable[[List[str], str], str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Verify full-line matching with and without the C automaton.
+
+    Args:
+        automaton (bool): Whether to keep the automaton, if available.
+        temp_test_file (Callable): Fixture to create a test file.
+        monkeypatch (pytest.MonkeyPatch): Fixture to disable the automaton.
+    """
+    if not automaton:
+        monkeypatch.setattr(aho_corasick_search, "_AUTOMATON", None)
+
+    file_path = temp_test_file(["alpha\n", " beta \r\n", "\n"], "aho.txt")
+    searcher = AhoCorasickSearcher()
+    assert searcher.search(file_path, "beta") == "STRING EXISTS"
+    assert searcher.search(file_path, "") == "STRING EXISTS"
+    assert searcher.search(file_path, "alph") == "STRING NOT FOUND"
+    assert searcher.search(file_path, "alpha\n") == "STRING NOT FOUND"
+
+
+def test_mmap_reread_matches_only_whole_lines(
+    temp_test_file: Callable[[List[str], str], str],
+) -> None:
+    """
+    Verify whole-line matching on reread regardless of line endings.
+
+    Args:
+        temp_test_file (Callable): Fixture to create a test file.
+    """
+    file_path = temp_test_file(["xalpha\n", "beta\r\n", "gamma"], "mm.txt")
+    searcher = MmapSearcher()
+    for line in ("beta", "gamma"):
+        assert searcher.search(file_path, line, True) == "STRING EXISTS"
+    for line in ("alpha", "bet", "amma"):
+        assert searcher.search(file_path, line, True) == "STRING NOT FOUND"
+
+
+@pytest.mark.parametrize("reread", [True, False])
+def test_regex_searches_undecodable_files(
+    reread: bool, tmp_path: Path
+) -> None:
+    """
+    Verify that lines are matched without decoding the whole file.
+
+    Args:
+        reread (bool): Whether to reread the file on the query.
+        tmp_path (Path): Pytest temporary directory.
+    """
+    file_path = tmp_path / "latin1.txt"
+    file_path.write_bytes(b"caf\xe9\r\n beta \n")
+    searcher = RegexLineSearcher()
+    path = str(file_path)
+    assert searcher.search(path, "beta", reread) == "STRING EXISTS"
+    assert searcher.search(path, "caf", reread) == "STRING NOT FOUND"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires FIFOs")
+def test_line_by_line_streams_unmappable_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Verify that a file which cannot be memory mapped is streamed.
+
+    A tiny buffer forces lines to be split across reads.
+
+    Args:
+        tmp_path (Path): Pytest temporary directory.
+        monkeypatch (pytest.MonkeyPatch): Used to shrink the buffer.
+    """
+    monkeypatch.setattr(line_by_line, "_BUFFER_SIZE", 4)
+    fifo = tmp_path / "lines.fifo"
+    os.mkfifo(fifo)
+
+    def write() -> None:
+        with open(fifo, "w", encoding="utf-8") as f:
+            f.write("Hello\n  Find me  \nAnother line")
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    result = LineByLineSearcher().search(str(fifo), "Find me")
+    writer.join()
+
+    assert result == "STRING EXISTS"
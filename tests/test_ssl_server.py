@@ -12,39 +12,110 @@ Usage:
     ```
 """
 
+import functools
+import selectors
 import socket
 import ssl
+import threading
+from typing import Optional
 
+# Seconds between checks of the stop event while no client is waiting
+POLL_INTERVAL = 0.1
 
+# Seconds a client gets to complete its handshake and send a request
+CLIENT_TIMEOUT = 5.0
+
+
+@functools.lru_cache(maxsize=4)
+def _make_context(certfile: str, keyfile: str, cafile: str) -> ssl.SSLContext:
+    """
+    Build a server context requiring client certificates, once per files.
+
+    Args:
+        certfile (str): Path to the server's certificate file.
+        keyfile (str): Path to the server's private key file.
+        cafile (str): Path to the CA certificate for client authentication.
+
+    Returns:
+        ssl.SSLContext: Context shared by every server using these files.
+    """
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.verify_mode = ssl.CERT_REQUIRED
+    context.load_cert_chain(certfile=certfile, keyfile=keyfile)
+    context.load_verify_locations(cafile=cafile)
+    return context
+
+
+def _serve_client(context: ssl.SSLContext, conn: socket.socket) -> None:
+    """
+    Authenticate one client, then receive and discard its request.
+
+    Args:
+        context (ssl.SSLContext): Server context requiring client certs.
+        conn (socket.socket): Freshly accepted plain connection.
+    """
+    conn.settimeout(CLIENT_TIMEOUT)
+    try:
+        with context.wrap_socket(conn, server_side=True) as sconn:
+            sconn.recv(1024)  # just receive and discard
+    except (ssl.SSLError, OSError):
+        # Rejected or vanished clients must not stop the server
+        conn.close()
+
+
+# pylint: disable-next=too-many-arguments
 def run_ssl_server(
     certfile: str,
     keyfile: str,
     cafile: str,
     host: str = "127.0.0.1",
     port: int = 5000,
+    *,
+    stop_event: Optional[threading.Event] = None,
+    ready: Optional[threading.Event] = None,
 ) -> None:
     """
     Start an SSL server that requires client authentication.
 
+    Clients are accepted from a readiness loop on a non-blocking socket,
+    one after another, until the stop event is set, so the server can be
+    shut down without a client having to connect.
+
     Args:
         certfile (str): Path to the server's certificate file.
         keyfile (str): Path to the server's private key file.
         cafile (str): Path to the CA certificate for client authentication.
         host (str): IP address to bind the server (default: "127.0.0.1").
         port (int): Port number to listen on (default: 5000).
+        stop_event (Optional[threading.Event]): Set to stop the server;
+            it runs until the process ends when omitted.
+        ready (Optional[threading.Event]): Set once the server listens,
+            so callers need not sleep before connecting.
     """
-    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-    context.verify_mode = ssl.CERT_REQUIRED
-    context.load_cert_chain(certfile=certfile, keyfile=keyfile)
-    context.load_verify_locations(cafile=cafile)
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    context = _make_context(certfile, keyfile, cafile)
 
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+    with socket.socket(
+        socket.AF_INET, socket.SOCK_STREAM
+    ) as sock, selectors.DefaultSelector() as selector:
         sock.bind((host, port))
         sock.listen(5)
-        with context.wrap_socket(sock, server_side=True) as ssock:
-            conn, _addr = ssock.accept()
-            conn.recv(1024)  # just receive and discard
-            conn.close()
+        sock.setblocking(False)
+        selector.register(sock, selectors.EVENT_READ)
+        if ready is not None:
+            ready.set()
+
+        while not stop_event.is_set():
+            if not selector.select(timeout=POLL_INTERVAL):
+                continue
+            try:
+                conn, _addr = sock.accept()
+            except BlockingIOError:
+                # The client gave up before it could be accepted
+                continue
+            _serve_client(context, conn)
 
 
 if __name__ == "__main__":
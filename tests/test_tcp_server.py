@@ -0,0 +1,160 @@
+"""
+Unit tests for SearchServer.
+
+The server runs its asyncio loop on an ephemeral port with SSL off, and
+its configuration is patched, so no configuration file or certificate is
+needed.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Iterator, Optional
+from unittest.mock import patch
+
+import pytest
+
+from core.framing import frame, read_msg
+from server.tcp_server import SearchServer
+
+# Seconds to wait for the server before failing the test
+TIMEOUT = 5.0
+
+
+@pytest.fixture
+def search_server(tmp_path: Path) -> Iterator[SearchServer]:
+    """Provide a server listening on an ephemeral port, SSL off."""
+    data_file = tmp_path / "data.txt"
+    data_file.write_text("Find me\n", encoding="utf-8")
+    settings = {"server_port": 0, "ssl_enabled": False, "max_clients": 1}
+
+    def config_value(
+        _path: str, key: str, default: Optional[Any] = None
+    ) -> Any:
+        return settings.get(key, default)
+
+    with patch("server.tcp_server.get_config_value", config_value):
+        server = SearchServer()
+    # pylint: disable-next=protected-access
+    server._setup_socket()
+    with patch.dict(
+        "core.connection_handler.SERVER_SETTINGS",
+        {
+            "client_timeout_time": TIMEOUT,
+            "linuxpath": str(data_file),
+            "reread": True,
+            "search_algorithm": "mmap",
+        },
+    ):
+        yield server
+    server.server_socket.close()
+
+
+async def _connect(
+    server: SearchServer,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Open a client connection to the server's listening port.
+
+    Args:
+        server (SearchServer): Server whose socket is listening.
+
+    Returns:
+        tuple[asyncio.StreamReader, asyncio.StreamWriter]: The streams.
+    """
+    port = server.server_socket.getsockname()[1]
+    return await asyncio.open_connection("127.0.0.1", port)
+
+
+async def _query(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, query: bytes
+) -> Optional[bytes]:
+    """
+    Send one query and wait for its reply.
+
+    Args:
+        reader (asyncio.StreamReader): Stream the reply arrives on.
+        writer (asyncio.StreamWriter): Stream the query is sent on.
+        query (bytes): Encoded search string.
+
+    Returns:
+        Optional[bytes]: The reply, or None if the server closed.
+    """
+    writer.write(frame(query))
+    return await asyncio.wait_for(read_msg(reader), TIMEOUT)
+
+
+def test_serve_answers_queries(search_server: SearchServer) -> None:
+    """
+    Verify that a served client gets answers to its queries.
+
+    Args:
+        search_server (SearchServer): Server under test.
+    """
+
+    async def scenario() -> tuple[Optional[bytes], Optional[bytes]]:
+        # pylint: disable-next=protected-access
+        serving = asyncio.create_task(search_server._serve())
+        reader, writer = await _connect(search_server)
+        found = await _query(reader, writer, b"Find me")
+        missing = await _query(reader, writer, b"Lost")
+        search_server.shutdown()
+        await asyncio.wait_for(serving, TIMEOUT)
+        return found, missing
+
+    found, missing = asyncio.run(scenario())
+
+    assert found is not None and found.startswith(b"STRING EXISTS")
+    assert missing is not None and missing.startswith(b"STRING NOT FOUND")
+
+
+def test_serve_refuses_clients_over_the_limit(
+    search_server: SearchServer,
+) -> None:
+    """
+    Verify that a client beyond max_clients is told the server is busy.
+
+    Args:
+        search_server (SearchServer): Server allowing one client.
+    """
+
+    async def scenario() -> tuple[Optional[bytes], Optional[bytes]]:
+        # pylint: disable-next=protected-access
+        serving = asyncio.create_task(search_server._serve())
+        reader, writer = await _connect(search_server)
+        # Answered, so the first client surely holds the only slot
+        await _query(reader, writer, b"Find me")
+        extra_reader, _ = await _connect(search_server)
+        busy = await asyncio.wait_for(read_msg(extra_reader), TIMEOUT)
+        after = await asyncio.wait_for(read_msg(extra_reader), TIMEOUT)
+        search_server.shutdown()
+        await asyncio.wait_for(serving, TIMEOUT)
+        return busy, after
+
+    busy, after = asyncio.run(scenario())
+
+    assert busy == b"ERROR: server busy"
+    assert after is None
+
+
+def test_shutdown_closes_clients_and_stops_serving(
+    search_server: SearchServer,
+) -> None:
+    """
+    Verify that shutdown() closes open clients and ends _serve.
+
+    Args:
+        search_server (SearchServer): Server under test.
+    """
+
+    async def scenario() -> Optional[bytes]:
+        # pylint: disable-next=protected-access
+        serving = asyncio.create_task(search_server._serve())
+        reader, writer = await _connect(search_server)
+        await _query(reader, writer, b"Find me")
+        search_server.shutdown()
+        # Returns only if serving stopped; a hang fails the test
+        await asyncio.wait_for(serving, TIMEOUT)
+        return await asyncio.wait_for(read_msg(reader), TIMEOUT)
+
+    assert asyncio.run(scenario()) is None
+    assert not search_server.log_config["clients"]
@@ -17,8 +17,13 @@ CSV_PATH = get_config_value(
     "utils/search_benchmark_results.csv",
 )
 
-# Load the CSV data
-df = pd.read_csv(CSV_PATH)
+# Column types of the benchmark CSV, so pandas skips type inference
+CSV_DTYPES = {
+    "File Size": "int64",
+    "Algorithm": "str",
+    "Avg Time (ms)": "float64",
+    "Avg Memory (MB)": "float64",
+}
 
 # Set Seaborn theme for better visuals
 sns.set(style="whitegrid")
@@ -31,13 +36,13 @@ def plot_execution_time(df: pd.DataFrame) -> None:
     )
 
     plt.figure(figsize=(12, 6))
-    for column in pivot_df.columns:
-        plt.plot(pivot_df.index, pivot_df[column], marker="o", label=column)
+    # One call plots every column, one line per algorithm
+    lines = plt.plot(pivot_df.index, pivot_df.to_numpy(), marker="o")
 
     plt.xlabel("File Size")
     plt.ylabel("Average Time (ms)")
     plt.title("Algorithm Performance by File Size")
-    plt.legend(title="Algorithm")
+    plt.legend(lines, pivot_df.columns, title="Algorithm")
     plt.xscale("log")
     plt.tight_layout()
     plt.savefig("utils/algorithm_performance_comp.png")
@@ -51,15 +56,12 @@ def plot_memory_usage(df: pd.DataFrame) -> None:
     )
 
     plt.figure(figsize=(12, 6))
-    for column in pivot_mem_df.columns:
-        plt.plot(
-            pivot_mem_df.index, pivot_mem_df[column], marker="s", label=column
-        )
+    lines = plt.plot(pivot_mem_df.index, pivot_mem_df.to_numpy(), marker="s")
 
     plt.xlabel("File Size")
     plt.ylabel("Average Memory (MB)")
     plt.title("Algorithm Memory Usage by File Size")
-    plt.legend(title="Algorithm")
+    plt.legend(lines, pivot_mem_df.columns, title="Algorithm")
     plt.xscale("log")
     plt.tight_layout()
     plt.savefig("utils/algorithm_memory_usage_comp.png")
@@ -120,6 +122,9 @@ def display_average_memory_table(avg_memory_df: pd.DataFrame) -> None:
 
 
 if __name__ == "__main__":
+    # Load the CSV data
+    df = pd.read_csv(CSV_PATH, dtype=CSV_DTYPES)
+
     plot_execution_time(df)
     plot_memory_usage(df)
 
@@ -15,9 +15,25 @@ from config.settings import CONFIG_FILE_PATH
 from core.config_loader import get_config_value
 
 
+# Normalized names and types of the load test CSV columns, in file order
+CSV_COLUMNS = {
+    "file_size": "int64",
+    "qps": "int32",
+    "avg_latency_ms": "float64",
+    "error_count": "int32",
+    "p50_latency_ms": "float64",
+    "p95_latency_ms": "float64",
+    "p99_latency_ms": "float64",
+}
+
+
 def load_data(csv_path: str) -> pd.DataFrame:
     """Load a CSV file into a pandas DataFrame."""
-    return pd.read_csv(csv_path)
+    # The header row is replaced by the normalized names, so the columns
+    # need no renaming and their types no inference
+    return pd.read_csv(
+        csv_path, header=0, names=list(CSV_COLUMNS), dtype=CSV_COLUMNS
+    )
 
 
 def plot_latency_vs_qps(df: pd.DataFrame) -> None:
@@ -121,16 +137,6 @@ if __name__ == "__main__":
     # Load the data from the CSV file
     df = load_data(csv_path)
 
-    # Clean up column names by removing spaces and converting to lowercase
-    df.rename(
-        columns=lambda x: x.strip()
-        .lower()
-        .replace(" ", "_")
-        .replace("(", "")
-        .replace(")", ""),
-        inplace=True,
-    )
-
     # Remove rows with latency of 0 and errors > 0
     df = df[df["avg_latency_ms"] > 0]
     df = df[(df["qps"] >= 1) & (df["qps"] <= 50)]